@@ -10,7 +10,9 @@ Usage:
     python backup_participants_event1.py
 
 The script will create:
-- backup_participants_event1.json: Contains all participant data
+- backup_participants_event1.json: Contains all participant data, plus the
+  event's divisions with their type and handicap range so restores don't
+  have to infer them from division names
 - restore_participants_event1.py: Script to restore the participants
 """
 
@@ -24,6 +26,7 @@ sys.path.append(str(Path(__file__).parent))
 
 from core.database import get_session
 from models.participant import Participant
+from models.event_division import EventDivision
 from sqlmodel import select
 
 
@@ -65,6 +68,20 @@ def backup_participants():
             }
             participants_data.append(participant_dict)
         
+        # Division classification, stored so restores are a plain lookup
+        divisions = session.exec(
+            select(EventDivision).where(EventDivision.event_id == 1)
+        ).all()
+        divisions_data = [
+            {
+                "name": division.name,
+                "division_type": division.division_type.value if division.division_type else None,
+                "handicap_min": division.handicap_min,
+                "handicap_max": division.handicap_max,
+            }
+            for division in divisions
+        ]
+        
         # Create backup data structure
         backup_data = {
             "backup_info": {
@@ -73,6 +90,7 @@ def backup_participants():
                 "total_participants": len(participants_data),
                 "description": "Backup of participants from Event ID 1 for testing purposes"
             },
+            "divisions": divisions_data,
             "participants": participants_data
         }
         
@@ -27,7 +27,7 @@ class Settings(BaseSettings):
     # Logging Security Features
     # Enable log encryption for sensitive logs (audit, security)
     log_encryption_enabled: bool = False
-    log_encryption_key: Optional[str] = None  # Base64 Fernet key from env
+    log_encryption_key: Optional[str] = None  # URL-safe base64 32-byte key from env
     log_encryption_password: Optional[str] = None  # Alternative: derive key from password
     log_encryption_salt: str = "abhimata-golf-logs-2024"
     encrypted_log_types: List[str] = ["audit", "security"]
@@ -37,12 +37,20 @@ class Settings(BaseSettings):
     log_hmac_secret: str = "change-this-hmac-secret-in-production"
     signed_log_types: List[str] = ["audit", "security"]
 
+    # Encrypt/sign log records on a background thread instead of the caller's
+    log_async_secure_handlers: bool = True
+    # Records that may wait for the background writer (0 = unbounded), and
+    # what a caller does when that many are waiting: "block" or "drop"
+    log_queue_max_records: int = 10000
+    log_overflow_policy: str = "block"
+
     # Log retention and archival (days)
     log_retention_days_app: int = 30
     log_retention_days_audit: int = 365
     log_retention_days_security: int = 365
     log_retention_days_performance: int = 7
     log_retention_days_error: int = 90
+    log_archive_codec: str = "zstd"  # "zstd" (needs zstandard) or "gzip"
     
     class Config:
         env_file = ".env"
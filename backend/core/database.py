@@ -1,15 +1,38 @@
 from sqlmodel import SQLModel, create_engine, Session
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import sessionmaker
 from core.config import settings
 import os
 
 
+def _dialect_engine_options(database_url: str) -> dict:
+    """Per-dialect tuning for batched writes (executemany)
+
+    - postgresql+psycopg2: send executemany as multi-row VALUES / batches
+    - mssql+pyodbc: let pyodbc bind parameter arrays in one round-trip
+    - sqlite: executemany is already in-process, nothing to tune
+    """
+    drivername = make_url(database_url).drivername
+    if drivername in ("postgresql", "postgresql+psycopg2"):
+        return {"executemany_mode": "values_plus_batch", "insertmanyvalues_page_size": 1000}
+    if drivername == "mssql+pyodbc":
+        return {"fast_executemany": True}
+    return {}
+
+
 # Create database engine
 engine = create_engine(
     settings.database_url,
     echo=settings.debug,  # Log SQL queries in debug mode
-    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {}
+    query_cache_size=1200,  # Compiled statement cache, sized for the app's query variety
+    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {},
+    **_dialect_engine_options(settings.database_url)
 )
 
+# Session factory for scripts that commit several times: objects keep their
+# loaded attributes after commit instead of being re-SELECTed on next access
+SessionLocal = sessionmaker(bind=engine, class_=Session, expire_on_commit=False)
+
 
 def create_db_and_tables():
     """Create database tables"""
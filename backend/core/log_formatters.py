@@ -6,12 +6,50 @@ with support for structured logging and request correlation.
 """
 
 import json
+import time
 import logging
 import traceback
 from datetime import datetime
 from typing import Any, Dict, Optional
 
 
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that formats each second's timestamp only once
+
+    Records logged within the same second share the strftime result; only
+    the milliseconds are formatted per record. Output is identical to
+    logging.Formatter.formatTime.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, date format, formatted text), replaced as a whole so
+        # records formatted on different threads never see a torn entry
+        self._time_cache = (None, None, None)
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """
+        Format the record's creation time
+
+        Args:
+            record: Log record
+            datefmt: strftime format (default: logging's default time format)
+
+        Returns:
+            Formatted timestamp
+        """
+        second = int(record.created)
+        cached_second, cached_datefmt, text = self._time_cache
+        if second != cached_second or datefmt != cached_datefmt:
+            text = time.strftime(datefmt or self.default_time_format, self.converter(record.created))
+            self._time_cache = (second, datefmt, text)
+
+        if datefmt or not self.default_msec_format:
+            return text
+        return self.default_msec_format % (text, record.msecs)
+
+
 class JSONFormatter(logging.Formatter):
     """
     JSON formatter for structured logging
@@ -117,7 +155,7 @@ class JSONFormatter(logging.Formatter):
         return json.dumps(log_data, default=str, ensure_ascii=False)
 
 
-class TextFormatter(logging.Formatter):
+class TextFormatter(CachedTimeFormatter):
     """
     Text formatter for human-readable logging
 
@@ -205,7 +243,7 @@ class TextFormatter(logging.Formatter):
         return formatted
 
 
-class CompactTextFormatter(logging.Formatter):
+class CompactTextFormatter(CachedTimeFormatter):
     """
     Compact text formatter for production environments
 
@@ -231,7 +269,7 @@ class CompactTextFormatter(logging.Formatter):
         Returns:
             Compact formatted string
         """
-        timestamp = datetime.fromtimestamp(record.created).strftime(self.datefmt)
+        timestamp = self.formatTime(record, self.datefmt)
 
         # Build compact log line
         parts = [
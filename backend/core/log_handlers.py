@@ -7,11 +7,14 @@ cross-platform log rotation, and directory-based log organization.
 
 import os
 import re
+import stat
 import logging
 import platform
 from typing import Dict, List, Pattern, Optional
 from logging.handlers import RotatingFileHandler
 
+from core.log_formatters import CachedTimeFormatter
+
 # Try to import concurrent-log-handler for Windows-safe rotation
 try:
     from concurrent_log_handler import ConcurrentRotatingFileHandler
@@ -36,12 +39,29 @@ SENSITIVE_PATTERNS: Dict[str, Pattern] = {
     'email_partial': re.compile(r'\b([a-zA-Z0-9._%+-]{1,3})[a-zA-Z0-9._%+-]*@'),
 }
 
+# Lowercase substrings at least one of which must occur in a message for
+# the pattern to match. Patterns whose hints are all absent are skipped,
+# which for ordinary messages is most of them. Patterns without hints
+# (including custom ones) always run. The hints are only consulted for
+# ASCII messages: re.IGNORECASE also matches non-ASCII case variants
+# ('ſ' for 's', 'K' (Kelvin sign) for 'k', 'ı' for 'i'), which neither
+# lower() nor casefold() map onto the ASCII hint.
+PATTERN_HINTS: Dict[str, tuple] = {
+    'password': ('passw', 'pwd'),
+    'token': ('token',),
+    'api_key': ('api',),
+    'secret': ('secret',),
+    'authorization': ('auth',),
+    'cookie': ('cookie',),
+    'email_partial': ('@',),
+}
+
 # Redaction marker
 REDACTED = '[REDACTED]'
 EMAIL_REDACTED = r'\1***@'
 
 
-class RedactingFormatter(logging.Formatter):
+class RedactingFormatter(CachedTimeFormatter):
     """
     Formatter that automatically redacts sensitive information from log messages
 
@@ -71,6 +91,17 @@ class RedactingFormatter(logging.Formatter):
         if custom_patterns:
             self.patterns.update(custom_patterns)
 
+        # (name, pattern, hints, value group) in application order
+        self._redactions = [
+            (
+                name,
+                pattern,
+                None if custom_patterns and name in custom_patterns else PATTERN_HINTS.get(name),
+                1 if pattern.groups else None,
+            )
+            for name, pattern in self.patterns.items()
+        ]
+
     def format(self, record: logging.LogRecord) -> str:
         """
         Format log record with sensitive data redaction
@@ -101,19 +132,36 @@ class RedactingFormatter(logging.Formatter):
             Message with sensitive data redacted
         """
         redacted = message
+        # isascii() is a flag check on str; non-ASCII messages run every pattern
+        lowered = message.lower() if message.isascii() else None
+
+        # Apply each redaction pattern that can possibly match
+        for pattern_name, pattern, hints, value_group in self._redactions:
+            if (hints is not None and lowered is not None
+                    and not any(hint in lowered for hint in hints)):
+                continue
 
-        # Apply each redaction pattern
-        for pattern_name, pattern in self.patterns.items():
             if pattern_name == 'email_partial':
                 # Partial email redaction: keep first 1-3 chars + domain
                 redacted = pattern.sub(EMAIL_REDACTED, redacted)
+            elif value_group is None:
+                # No capture group (card numbers, SSNs): redact the whole match
+                redacted = pattern.sub(REDACTED, redacted)
             else:
-                # Full redaction for other patterns
-                redacted = pattern.sub(lambda m: m.group(0).replace(m.group(1), REDACTED), redacted)
+                # Full redaction of the value, keeping the key (e.g. "password=")
+                redacted = pattern.sub(_redact_value, redacted)
 
         return redacted
 
 
+def _redact_value(match: re.Match) -> str:
+    """Replace a match's first group with REDACTED, leaving the rest intact"""
+    start = match.start(1) - match.start()
+    end = match.end(1) - match.start()
+    text = match.group(0)
+    return text[:start] + REDACTED + text[end:]
+
+
 def get_rotating_handler(
     filename: str,
     max_bytes: int = 10 * 1024 * 1024,  # 10MB default
@@ -161,8 +209,8 @@ def get_rotating_handler(
             delay=delay
         )
     else:
-        # Unix/Linux - standard RotatingFileHandler works fine
-        return RotatingFileHandler(
+        # Unix/Linux - standard rotation works fine
+        return BatchingRotatingFileHandler(
             filename=filename,
             mode='a',
             maxBytes=max_bytes,
@@ -172,6 +220,54 @@ def get_rotating_handler(
         )
 
 
+class BatchingRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that tracks the file size itself and can defer flushes
+
+    The stock handler stats the path twice, formats the record an extra
+    time and seeks the stream (flushing it) on every record just to decide
+    whether to roll over. This one keeps a running byte count instead, so a
+    record is one format and one buffered write. While defer_flush is set
+    (by BatchingQueueListener for the length of a batch) records stay in
+    the stream buffer and reach the file in a single write when it is reset.
+    """
+
+    defer_flush = False
+
+    def _open(self):
+        stream = super()._open()
+        st = os.fstat(stream.fileno())
+        self.stream_size = st.st_size
+        # See bpo-45401: never roll over anything other than regular files
+        self.rotatable = stat.S_ISREG(st.st_mode)
+        return stream
+
+    def emit(self, record: logging.LogRecord):
+        """Write a record, rolling the file over first if it would get too big"""
+        try:
+            msg = self.format(record) + self.terminator
+            # maxBytes is in bytes, so count the encoded size of the record
+            if msg.isascii():
+                size = len(msg)
+            else:
+                size = len(msg.encode(self.encoding or 'utf-8', self.errors or 'strict'))
+            if self.stream is None:
+                self.stream = self._open()
+            if (self.maxBytes > 0 and self.rotatable and
+                    self.stream_size + size >= self.maxBytes):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self.stream_size += size
+            if not self.defer_flush:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
 class DirectoryBasedHandler(logging.Handler):
     """
     Handler that routes log records to different files based on log level
@@ -2,7 +2,7 @@
 Log Security Module
 
 Provides security features for logging including:
-- Log encryption (AES-256) for sensitive log files
+- Log encryption (AES-256-GCM) for sensitive log files
 - HMAC tamper detection for audit logs
 - Key management and rotation
 - Secure key derivation from passwords
@@ -12,22 +12,88 @@ Security features are configurable per log type.
 
 import os
 import hmac
-import hashlib
+import copy
+import mmap
+import queue
+import atexit
 import base64
-from typing import Optional, Dict, Any
+import multiprocessing
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, Dict, Any, List, Tuple
+from cryptography.exceptions import InvalidTag
 from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.backends import default_backend
 import logging
 
 
+# AES-GCM nonce size in bytes (96 bits, the size GCM is designed for)
+GCM_NONCE_SIZE = 12
+
+# Separator between a signed log entry and its HMAC, as stored on disk
+SIGNATURE_MARKER = b' | HMAC:'
+
+# Signatures are HMAC-SHA256 truncated to 128 bits (RFC 2104 allows
+# truncation to half the hash length), stored as unpadded URL-safe base64
+SIGNATURE_TAG_BYTES = 16
+
+# Length of the full hex HMAC-SHA256 signatures written by older versions,
+# which are still verified
+LEGACY_HEX_SIGNATURE_LENGTH = 64
+
+# Most queued records a listener writes before flushing its handlers
+MAX_LOG_BATCH = 256
+
+# What a caller does when a bounded log queue is full: wait for the
+# listener to make room, or drop the record and count it
+LOG_OVERFLOW_POLICIES = ('block', 'drop')
+
+# Log files of at least this many bytes are verified across worker
+# processes, each reading its own newline-aligned slice of about
+# VERIFY_CHUNK_BYTES straight from the file. Workers are spawned rather
+# than forked: forking while log listener threads hold locks can leave
+# a child deadlocked
+PARALLEL_VERIFY_MIN_BYTES = 8 * 1024 * 1024
+VERIFY_CHUNK_BYTES = 1024 * 1024
+
+
+@lru_cache(maxsize=32)
+def _pbkdf2_key(password: str, salt: bytes) -> bytes:
+    """
+    Run PBKDF2 for a (password, salt) pair, cached per process
+
+    100k SHA-256 iterations dominate LogEncryption construction, and the
+    result is deterministic, so each pair is only derived once.
+
+    Args:
+        password: User password
+        salt: Salt for key derivation
+
+    Returns:
+        URL-safe base64-encoded 32-byte key
+    """
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=100000,
+        backend=default_backend()
+    )
+    return base64.urlsafe_b64encode(kdf.derive(password.encode()))
+
+
 class LogEncryption:
     """
-    Handle log encryption using Fernet (AES-256)
+    Handle log encryption using AES-256-GCM
 
     Features:
-    - AES-256 encryption for sensitive log files
+    - AES-256-GCM authenticated encryption for sensitive log files
+      (hardware-accelerated via AES-NI/CLMUL; the GCM tag doubles as a MAC)
+    - Decryption of entries written by the earlier Fernet format
     - Key derivation from password using PBKDF2
     - Secure key storage in environment variables
     - Per-log-type encryption control
@@ -38,21 +104,36 @@ class LogEncryption:
         Initialize log encryption
 
         Args:
-            encryption_key: Base64-encoded Fernet key (32 bytes)
+            encryption_key: URL-safe base64-encoded key (32 bytes)
             password: Password for key derivation (alternative to encryption_key)
         """
         self.cipher = None
+        self._legacy_cipher = None
 
         if encryption_key:
             # Use provided key directly
             try:
-                self.cipher = Fernet(encryption_key.encode() if isinstance(encryption_key, str) else encryption_key)
+                self._init_ciphers(encryption_key.encode() if isinstance(encryption_key, str) else encryption_key)
             except Exception as e:
                 logging.warning(f"Invalid encryption key: {e}")
         elif password:
             # Derive key from password
             key = self._derive_key_from_password(password)
-            self.cipher = Fernet(key)
+            self._init_ciphers(key)
+
+    def _init_ciphers(self, key: bytes):
+        """
+        Create the AES-GCM cipher and the Fernet cipher for legacy entries
+
+        Args:
+            key: URL-safe base64-encoded 32-byte key
+        """
+        raw_key = base64.urlsafe_b64decode(key)
+        if len(raw_key) != 32:
+            raise ValueError("Encryption key must be 32 url-safe base64-encoded bytes")
+
+        self.cipher = AESGCM(raw_key)
+        self._legacy_cipher = Fernet(key)
 
     @staticmethod
     def _derive_key_from_password(password: str, salt: Optional[bytes] = None) -> bytes:
@@ -64,22 +145,14 @@ class LogEncryption:
             salt: Salt for key derivation (uses fixed salt if not provided)
 
         Returns:
-            Base64-encoded Fernet key
+            URL-safe base64-encoded 32-byte key
         """
         # Use fixed salt from environment or default
         # In production, store salt securely
         if salt is None:
             salt = os.environ.get('LOG_ENCRYPTION_SALT', 'abhimata-golf-logs-2024').encode()
 
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-            backend=default_backend()
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
-        return key
+        return _pbkdf2_key(password, salt)
 
     @staticmethod
     def generate_key() -> str:
@@ -87,9 +160,9 @@ class LogEncryption:
         Generate new encryption key
 
         Returns:
-            Base64-encoded Fernet key as string
+            URL-safe base64-encoded 32-byte key as string
         """
-        return Fernet.generate_key().decode()
+        return base64.urlsafe_b64encode(AESGCM.generate_key(bit_length=256)).decode()
 
     def encrypt(self, data: str) -> Optional[str]:
         """
@@ -105,8 +178,9 @@ class LogEncryption:
             return data  # Return plain text if encryption not configured
 
         try:
-            encrypted = self.cipher.encrypt(data.encode())
-            return base64.b64encode(encrypted).decode()
+            nonce = os.urandom(GCM_NONCE_SIZE)
+            encrypted = self.cipher.encrypt(nonce, data.encode(), None)
+            return base64.b64encode(nonce + encrypted).decode()
         except Exception as e:
             logging.error(f"Encryption failed: {e}")
             return None
@@ -126,7 +200,13 @@ class LogEncryption:
 
         try:
             decoded = base64.b64decode(encrypted_data.encode())
-            decrypted = self.cipher.decrypt(decoded)
+            try:
+                decrypted = self.cipher.decrypt(
+                    decoded[:GCM_NONCE_SIZE], decoded[GCM_NONCE_SIZE:], None
+                )
+            except InvalidTag:
+                # Entries written before the switch to AES-GCM are Fernet tokens
+                decrypted = self._legacy_cipher.decrypt(decoded)
             return decrypted.decode()
         except InvalidToken:
             logging.error("Decryption failed: Invalid token or corrupted data")
@@ -158,6 +238,8 @@ class LogTamperDetection:
             secret_key: Secret key for HMAC generation
         """
         self.secret_key = secret_key or os.environ.get('LOG_HMAC_SECRET', 'default-hmac-secret-change-in-production')
+        # Keyed HMAC state (ipad/opad already absorbed), copied per signature
+        self._hmac_template = hmac.new(self.secret_key.encode(), digestmod='sha256')
 
     def generate_signature(self, message: str) -> str:
         """
@@ -167,14 +249,31 @@ class LogTamperDetection:
             message: Log message to sign
 
         Returns:
-            Hex-encoded HMAC signature
+            Truncated HMAC signature, URL-safe base64 without padding
         """
-        signature = hmac.new(
-            self.secret_key.encode(),
-            message.encode(),
-            hashlib.sha256
-        ).hexdigest()
-        return signature
+        return self._encoded_tag(message.encode()).decode('ascii')
+
+    def _digest(self, data: bytes) -> bytes:
+        """HMAC-SHA256 of raw bytes (one C-level update)"""
+        signer = self._hmac_template.copy()
+        signer.update(data)
+        return signer.digest()
+
+    def _encoded_tag(self, data: bytes) -> bytes:
+        """Signature of raw bytes as written to disk: a 22-character base64 tag"""
+        tag = self._digest(data)[:SIGNATURE_TAG_BYTES]
+        return base64.urlsafe_b64encode(tag).rstrip(b'=')
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle without the HMAC state (sent to verification worker processes)"""
+        state = self.__dict__.copy()
+        del state['_hmac_template']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        """Rebuild the HMAC state after unpickling"""
+        self.__dict__.update(state)
+        self._hmac_template = hmac.new(self.secret_key.encode(), digestmod='sha256')
 
     def verify_signature(self, message: str, signature: str) -> bool:
         """
@@ -182,13 +281,30 @@ class LogTamperDetection:
 
         Args:
             message: Original log message
-            signature: Hex-encoded HMAC signature
+            signature: Signature from sign_log_entry (or a legacy hex signature)
+
+        Returns:
+            True if signature is valid, False otherwise
+        """
+        return self.verify_signature_bytes(message.encode(), signature.encode())
+
+    def verify_signature_bytes(self, message: bytes, signature: bytes) -> bool:
+        """
+        Verify HMAC signature of a message read from disk, without decoding it
+
+        Args:
+            message: Original log message as UTF-8 bytes
+            signature: Signature as ASCII bytes; full hex signatures written
+                by older versions are also accepted
 
         Returns:
             True if signature is valid, False otherwise
         """
-        expected_signature = self.generate_signature(message)
-        return hmac.compare_digest(expected_signature, signature)
+        if len(signature) == LEGACY_HEX_SIGNATURE_LENGTH:
+            expected = self._digest(message).hex().encode()
+        else:
+            expected = self._encoded_tag(message)
+        return hmac.compare_digest(expected, signature)
 
     def sign_log_entry(self, log_entry: str) -> str:
         """
@@ -293,7 +409,9 @@ class SecureLogHandler(logging.Handler):
             # Format the record
             msg = self.format(record)
 
-            # Add HMAC signature if enabled
+            # Add HMAC signature if enabled. Entries are signed before they
+            # are encrypted, so the signature survives decrypt_log_file and
+            # can still be checked with the (separate) HMAC key
             if self.enable_signatures and self.tamper_detection:
                 msg = self.tamper_detection.sign_log_entry(msg)
 
@@ -326,6 +444,175 @@ class SecureLogHandler(logging.Handler):
         super().close()
 
 
+class DeferredFormatQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves formatting to the handler behind the queue
+
+    The stock QueueHandler formats records before enqueueing them, which
+    would make the wrapped handler format them a second time.
+    """
+
+    def __init__(self, queue: queue.Queue, overflow_policy: str = 'block'):
+        """
+        Initialize queue handler
+
+        Args:
+            queue: Queue read by the listener
+            overflow_policy: "block" or "drop" when a bounded queue is full
+        """
+        super().__init__(queue)
+        self.block = overflow_policy == 'block'
+        self.dropped = 0  # Approximate under contention; it is only a counter
+
+    def handle(self, record: logging.LogRecord):
+        """
+        Filter and enqueue a record without taking the handler lock
+
+        Handler.handle serializes emit() behind a per-handler lock, but
+        enqueueing is already thread-safe, so concurrent callers would only
+        be contending for a lock that protects nothing.
+        """
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv  # Python 3.12+ filters may return a replacement record
+        if rv:
+            self.emit(record)
+        return rv
+
+    def enqueue(self, record: logging.LogRecord):
+        """Enqueue a record, applying the overflow policy if the queue is full"""
+        if self.block:
+            self.queue.put(record)
+        else:
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                self.dropped += 1
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge args into the message and hand the record over unformatted"""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _iter_handler_chain(handler: logging.Handler):
+    """Yield a handler and the handlers it wraps (SecureLogHandler.base_handler)"""
+    while handler is not None:
+        yield handler
+        handler = getattr(handler, 'base_handler', None)
+
+
+class BatchingQueueListener(QueueListener):
+    """
+    QueueListener that handles whatever has queued up as one batch
+
+    Handlers that support it (defer_flush) buffer the batch's records and
+    are flushed once at the end, so a burst of log calls costs one write
+    per file instead of one per record. Records are only marked done after
+    that flush, so flush_queued_handler still means "on disk".
+    """
+
+    running = False
+
+    def start(self):
+        """Start the listener thread"""
+        super().start()
+        self.running = True
+
+    def stop(self):
+        """Drain the queue and stop the thread; does nothing if not running"""
+        if self.running:
+            self.running = False
+            super().stop()
+
+    def enqueue_sentinel(self):
+        """Queue the stop marker, waiting for room if the queue is bounded and full"""
+        self.queue.put(self._sentinel)
+
+    def _set_deferred_flush(self, deferred: bool):
+        for handler in self.handlers:
+            for inner in _iter_handler_chain(handler):
+                if hasattr(inner, 'defer_flush'):
+                    inner.defer_flush = deferred
+                    if not deferred:
+                        inner.flush()
+
+    def _monitor(self):
+        q = self.queue
+        while True:
+            batch = [self.dequeue(True)]
+            try:
+                while len(batch) < MAX_LOG_BATCH:
+                    batch.append(self.dequeue(False))
+            except queue.Empty:
+                pass
+
+            stopping = False
+            self._set_deferred_flush(True)
+            try:
+                for record in batch:
+                    if record is self._sentinel:
+                        stopping = True
+                    else:
+                        self.handle(record)
+            finally:
+                self._set_deferred_flush(False)
+                for _ in batch:
+                    q.task_done()
+
+            if stopping:
+                break
+
+
+def create_queued_handler(
+    handler: logging.Handler,
+    max_records: int = 0,
+    overflow_policy: str = 'block'
+) -> Tuple[QueueHandler, QueueListener]:
+    """
+    Run a handler on a background thread
+
+    Loggers get the returned QueueHandler, which only enqueues records; the
+    listener thread does the wrapped handler's work (encryption, signing,
+    file writes), writing queued-up records in batches. The listener is
+    stopped, draining the queue, at exit.
+
+    Args:
+        handler: Handler to run behind the queue
+        max_records: Most records waiting in the queue (0 = unbounded)
+        overflow_policy: "block" or "drop" when the queue is full
+
+    Returns:
+        Tuple of (queue_handler, listener)
+
+    Raises:
+        ValueError: If overflow_policy is not one of LOG_OVERFLOW_POLICIES
+    """
+    if overflow_policy not in LOG_OVERFLOW_POLICIES:
+        raise ValueError(
+            f"Unknown log overflow policy {overflow_policy!r}, "
+            f"expected one of {LOG_OVERFLOW_POLICIES}"
+        )
+
+    log_queue = queue.Queue(max_records)
+    listener = BatchingQueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return DeferredFormatQueueHandler(log_queue, overflow_policy), listener
+
+
+def flush_queued_handler(listener: QueueListener):
+    """
+    Block until every record queued so far has been handled
+
+    Args:
+        listener: Listener returned by create_queued_handler
+    """
+    listener.queue.join()
+
+
 # Global instances (lazy initialization)
 _log_encryption: Optional[LogEncryption] = None
 _log_tamper_detection: Optional[LogTamperDetection] = None
@@ -389,8 +676,10 @@ def decrypt_log_file(input_file: str, output_file: str, encryption: Optional[Log
         with open(output_file, 'w', encoding='utf-8') as f_out:
             for line in f_in:
                 line = line.strip()
-                if line.startswith('[ENCRYPTED] '):
-                    encrypted_data = line[12:]  # Remove '[ENCRYPTED] ' prefix
+                # The file handler's formatter may have put its own prefix
+                # in front of the marker; the encrypted entry carries its own
+                _, marker, encrypted_data = line.partition('[ENCRYPTED] ')
+                if marker:
                     decrypted = encryption.decrypt(encrypted_data)
                     if decrypted:
                         f_out.write(decrypted + '\n')
@@ -398,20 +687,22 @@ def decrypt_log_file(input_file: str, output_file: str, encryption: Optional[Log
                     f_out.write(line + '\n')
 
 
-def verify_log_file_integrity(log_file: str, tamper_detection: Optional[LogTamperDetection] = None) -> Dict[str, Any]:
+def _verify_lines(
+    tamper_detection: LogTamperDetection,
+    lines: List[bytes],
+    first_line_num: int
+) -> Dict[str, Any]:
     """
-    Verify integrity of log file with HMAC signatures
+    Verify a run of raw log lines
 
     Args:
-        log_file: Path to log file
-        tamper_detection: LogTamperDetection instance (uses global if not provided)
+        tamper_detection: LogTamperDetection instance
+        lines: Raw lines without their trailing newline
+        first_line_num: 1-based line number of lines[0]
 
     Returns:
-        Dictionary with verification results
+        Dictionary with verification results for these lines
     """
-    if tamper_detection is None:
-        tamper_detection = get_log_tamper_detection()
-
     results = {
         'total_entries': 0,
         'signed_entries': 0,
@@ -420,25 +711,111 @@ def verify_log_file_integrity(log_file: str, tamper_detection: Optional[LogTampe
         'tampered_entries': []
     }
 
-    with open(log_file, 'r', encoding='utf-8') as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
-                continue
+    # Lines are checked as bytes: the signed message is hashed exactly as
+    # stored, with no decode/re-encode round trip per line
+    for line_num, raw_line in enumerate(lines, first_line_num):
+        line = raw_line.strip()
+        if not line:
+            continue
 
-            results['total_entries'] += 1
+        results['total_entries'] += 1
 
-            if ' | HMAC:' in line:
-                results['signed_entries'] += 1
-                verification = tamper_detection.verify_log_entry(line)
+        if SIGNATURE_MARKER in line:
+            results['signed_entries'] += 1
+            message, _, signature = line.rpartition(SIGNATURE_MARKER)
 
-                if verification['valid']:
-                    results['valid_signatures'] += 1
-                else:
-                    results['invalid_signatures'] += 1
-                    results['tampered_entries'].append({
-                        'line_number': line_num,
-                        'error': verification.get('error', 'Invalid signature')
-                    })
+            if tamper_detection.verify_signature_bytes(message, signature):
+                results['valid_signatures'] += 1
+            else:
+                results['invalid_signatures'] += 1
+                results['tampered_entries'].append({
+                    'line_number': line_num,
+                    'error': 'Invalid signature'
+                })
+
+    return results
+
+
+def _verify_file_range(
+    tamper_detection: LogTamperDetection,
+    log_file: str,
+    start: int,
+    end: int
+) -> Tuple[Dict[str, Any], int]:
+    """
+    Verify the lines in one newline-aligned byte range of a log file
+
+    Runs in a worker process, so only the offsets are sent to it rather
+    than the lines themselves.
+
+    Returns:
+        Verification results numbered from line 1 of the range, and the
+        number of newlines in the range
+    """
+    fd = os.open(log_file, os.O_RDONLY)
+    try:
+        data = os.pread(fd, end - start, start)
+    finally:
+        os.close(fd)
+    return _verify_lines(tamper_detection, data.split(b'\n'), 1), data.count(b'\n')
+
+
+def _newline_aligned_ranges(log_file: str, size: int, chunk_size: int) -> List[Tuple[int, int]]:
+    """Split a file into byte ranges of about chunk_size that end just past a newline"""
+    ranges = []
+    with open(log_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < size:
+            newline = mm.find(b'\n', min(start + chunk_size, size) - 1)
+            end = size if newline == -1 else newline + 1
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def verify_log_file_integrity(log_file: str, tamper_detection: Optional[LogTamperDetection] = None) -> Dict[str, Any]:
+    """
+    Verify integrity of log file with HMAC signatures
+
+    The file is read in one call and split into lines in C. Large files are
+    split at newlines found through a memory map and verified range by range
+    across worker processes on multi-core machines.
+
+    Args:
+        log_file: Path to log file
+        tamper_detection: LogTamperDetection instance (uses global if not provided)
+
+    Returns:
+        Dictionary with verification results
+    """
+    if tamper_detection is None:
+        tamper_detection = get_log_tamper_detection()
+
+    size = os.path.getsize(log_file)
+    if size < PARALLEL_VERIFY_MIN_BYTES or (os.cpu_count() or 1) < 2:
+        with open(log_file, 'rb') as f:
+            return _verify_lines(tamper_detection, f.read().split(b'\n'), 1)
+
+    ranges = _newline_aligned_ranges(log_file, size, VERIFY_CHUNK_BYTES)
+    with ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn')) as executor:
+        chunk_results = list(executor.map(
+            _verify_file_range,
+            [tamper_detection] * len(ranges),
+            [log_file] * len(ranges),
+            [start for start, _ in ranges],
+            [end for _, end in ranges]
+        ))
+
+    # Merge range results in file order, renumbering lines from the start
+    # of the file
+    results = chunk_results[0][0]
+    line_offset = chunk_results[0][1]
+    for chunk, newlines in chunk_results[1:]:
+        for key in ('total_entries', 'signed_entries', 'valid_signatures', 'invalid_signatures'):
+            results[key] += chunk[key]
+        for entry in chunk['tampered_entries']:
+            entry['line_number'] += line_offset
+            results['tampered_entries'].append(entry)
+        line_offset += newlines
 
     return results
@@ -12,12 +12,18 @@ Provides unified logging interface with security best practices including:
 
 import logging
 import os
-from typing import Optional, Dict, Any
+from logging.handlers import QueueListener
+from typing import Optional, Dict, Any, List, Tuple
 from enum import Enum
 from contextvars import ContextVar
 
 from core.config import settings
-from core.log_formatters import JSONFormatter, TextFormatter, CompactTextFormatter
+from core.log_formatters import (
+    CachedTimeFormatter,
+    JSONFormatter,
+    TextFormatter,
+    CompactTextFormatter
+)
 from core.log_handlers import (
     get_rotating_handler,
     create_handler_for_log_type,
@@ -25,7 +31,11 @@ from core.log_handlers import (
     RedactingFormatter
 )
 from core.log_security import (
+    LogEncryption,
+    LogTamperDetection,
     SecureLogHandler,
+    create_queued_handler,
+    flush_queued_handler,
     get_log_encryption,
     get_log_tamper_detection
 )
@@ -38,6 +48,15 @@ _user_email: ContextVar[Optional[str]] = ContextVar('user_email', default=None)
 _ip_address: ContextVar[Optional[str]] = ContextVar('ip_address', default=None)
 _session_id: ContextVar[Optional[str]] = ContextVar('session_id', default=None)
 
+# Record attribute name for each request context variable
+_CONTEXT_VARS = (
+    ('request_id', _request_id),
+    ('user_id', _user_id),
+    ('user_email', _user_email),
+    ('ip_address', _ip_address),
+    ('session_id', _session_id),
+)
+
 
 class LogType(str, Enum):
     """Types of logs in the system"""
@@ -57,6 +76,26 @@ class LogLevel(str, Enum):
     CRITICAL = "CRITICAL"
 
 
+# logging module level number for each LogLevel, resolved once
+_LEVEL_NUMBERS = {level: logging.getLevelName(level.value) for level in LogLevel}
+
+# Settings a service reads itself when building its loggers, so they can be
+# overridden per service; everything else comes from global state
+OVERRIDABLE_SETTINGS = frozenset({
+    'log_level',
+    'log_encryption_enabled',
+    'log_encryption_key',
+    'log_encryption_password',
+    'encrypted_log_types',
+    'log_tamper_detection_enabled',
+    'log_hmac_secret',
+    'signed_log_types',
+    'log_async_secure_handlers',
+    'log_queue_max_records',
+    'log_overflow_policy',
+})
+
+
 class CentralizedLoggingService:
     """
     Centralized logging service with security best practices
@@ -68,6 +107,7 @@ class CentralizedLoggingService:
     - Request correlation across all logs
     - Context management (user, IP, session)
     - Cross-platform log rotation
+    - Encryption/signing off the caller's thread
     """
 
     def __init__(
@@ -75,7 +115,9 @@ class CentralizedLoggingService:
         base_dir: str = "logs",
         use_json: bool = False,
         enable_redaction: bool = True,
-        enable_console: bool = True
+        enable_console: bool = True,
+        overrides: Optional[Dict[str, Any]] = None,
+        logger_prefix: str = "abhimata"
     ):
         """
         Initialize centralized logging service
@@ -85,12 +127,17 @@ class CentralizedLoggingService:
             use_json: Use JSON format for structured logging
             enable_redaction: Enable automatic sensitive data redaction
             enable_console: Also log to console
+            overrides: Setting values to use instead of the global settings
+            logger_prefix: Namespace for this service's logger names
         """
         self.base_dir = base_dir
         self.use_json = use_json
         self.enable_redaction = enable_redaction
         self.enable_console = enable_console
+        self.overrides: Dict[str, Any] = dict(overrides or {})
+        self.logger_prefix = logger_prefix
         self.loggers: Dict[str, logging.Logger] = {}
+        self.listeners: List[QueueListener] = []
 
         # Create base log directory
         os.makedirs(base_dir, exist_ok=True)
@@ -98,6 +145,12 @@ class CentralizedLoggingService:
         # Initialize loggers for each type
         self._initialize_loggers()
 
+    def _setting(self, name: str) -> Any:
+        """Read a setting, preferring this service's overrides"""
+        if name in self.overrides:
+            return self.overrides[name]
+        return getattr(settings, name)
+
     def _initialize_loggers(self):
         """Initialize loggers for different log types"""
         for log_type in LogType:
@@ -114,14 +167,14 @@ class CentralizedLoggingService:
         Returns:
             Configured logger instance
         """
-        logger_name = f"abhimata.{log_type}"
+        logger_name = f"{self.logger_prefix}.{log_type}"
         logger = logging.getLogger(logger_name)
 
         # Prevent duplicate handlers if logger already exists
         if logger.handlers:
             return logger
 
-        logger.setLevel(getattr(logging, settings.log_level.upper(), logging.INFO))
+        logger.setLevel(getattr(logging, self._setting('log_level').upper(), logging.INFO))
         logger.propagate = False  # Don't propagate to root logger
 
         # Create formatter
@@ -135,7 +188,7 @@ class CentralizedLoggingService:
                     enabled=True
                 )
             else:
-                formatter = logging.Formatter(
+                formatter = CachedTimeFormatter(
                     fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
                 )
 
@@ -148,18 +201,31 @@ class CentralizedLoggingService:
 
         # Wrap with security features if enabled for this log type
         enable_encryption = (
-            settings.log_encryption_enabled and
-            log_type in settings.encrypted_log_types
+            self._setting('log_encryption_enabled') and
+            log_type in self._setting('encrypted_log_types')
         )
         enable_signatures = (
-            settings.log_tamper_detection_enabled and
-            log_type in settings.signed_log_types
+            self._setting('log_tamper_detection_enabled') and
+            log_type in self._setting('signed_log_types')
         )
 
         if enable_encryption or enable_signatures:
             # Get security components
-            encryption = get_log_encryption() if enable_encryption else None
-            tamper_detection = get_log_tamper_detection() if enable_signatures else None
+            encryption = None
+            if enable_encryption:
+                if {'log_encryption_key', 'log_encryption_password'} & self.overrides.keys():
+                    encryption = LogEncryption(
+                        encryption_key=self.overrides.get('log_encryption_key'),
+                        password=self.overrides.get('log_encryption_password')
+                    )
+                else:
+                    encryption = get_log_encryption()
+            tamper_detection = None
+            if enable_signatures:
+                if 'log_hmac_secret' in self.overrides:
+                    tamper_detection = LogTamperDetection(self.overrides['log_hmac_secret'])
+                else:
+                    tamper_detection = get_log_tamper_detection()
 
             # Wrap handler with security features
             secure_handler = SecureLogHandler(
@@ -170,7 +236,18 @@ class CentralizedLoggingService:
                 enable_signatures=enable_signatures
             )
             secure_handler.setFormatter(formatter)
-            logger.addHandler(secure_handler)
+
+            if self._setting('log_async_secure_handlers'):
+                # Callers only enqueue; crypto and file I/O run on the listener
+                queue_handler, listener = create_queued_handler(
+                    secure_handler,
+                    max_records=self._setting('log_queue_max_records'),
+                    overflow_policy=self._setting('log_overflow_policy')
+                )
+                self.listeners.append(listener)
+                logger.addHandler(queue_handler)
+            else:
+                logger.addHandler(secure_handler)
         else:
             # Use handler directly without security wrapper
             logger.addHandler(file_handler)
@@ -214,26 +291,51 @@ class CentralizedLoggingService:
             exc_info: Exception information
         """
         logger = self.get_logger(log_type)
+        levelno = _LEVEL_NUMBERS[level]
 
-        # Build extra context from context vars
-        extra = {
-            'request_id': _request_id.get(),
-            'user_id': _user_id.get(),
-            'user_email': _user_email.get(),
-            'ip_address': _ip_address.get(),
-            'session_id': _session_id.get(),
-        }
+        # Messages below the logger's level are dropped before any context
+        # is gathered
+        if not logger.isEnabledFor(levelno):
+            return
 
-        # Remove None values
-        extra = {k: v for k, v in extra.items() if v is not None}
+        # Build extra context from the context vars that are set
+        extra = {}
+        for name, var in _CONTEXT_VARS:
+            value = var.get()
+            if value is not None:
+                extra[name] = value
 
         # Add custom extra data
         if extra_data:
             extra['extra_data'] = extra_data
 
-        # Log at appropriate level
-        log_method = getattr(logger, level.value.lower())
-        log_method(message, extra=extra, exc_info=exc_info)
+        logger.log(levelno, message, extra=extra, exc_info=exc_info)
+
+    def flush(self):
+        """Wait until all queued (encrypted/signed) records are written"""
+        for listener in self.listeners:
+            flush_queued_handler(listener)
+
+    def close(self):
+        """
+        Stop the queue listeners and close every handler
+
+        A service built with overrides is also dropped from the cache, so
+        the next get_logging_service call with the same overrides builds a
+        new one.
+        """
+        for listener in self.listeners:
+            listener.stop()
+        self.listeners.clear()
+
+        for logger in self.loggers.values():
+            for handler in logger.handlers[:]:
+                logger.removeHandler(handler)
+                handler.close()
+
+        for key, service in list(_override_services.items()):
+            if service is self:
+                del _override_services[key]
 
     # Convenience methods for common log types
     def debug(self, message: str, **kwargs):
@@ -315,31 +417,74 @@ class CentralizedLoggingService:
         Returns:
             Dictionary with current context values
         """
-        return {
-            'request_id': _request_id.get(),
-            'user_id': _user_id.get(),
-            'user_email': _user_email.get(),
-            'ip_address': _ip_address.get(),
-            'session_id': _session_id.get(),
-        }
+        return {name: var.get() for name, var in _CONTEXT_VARS}
 
 
-# Global centralized logging service instance
+# Global centralized logging service instance and its log directory
 _logging_service: Optional[CentralizedLoggingService] = None
+GLOBAL_LOG_DIR = "logs"
+
+# Services built with setting overrides, keyed by base directory and the
+# override values
+_override_services: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], CentralizedLoggingService] = {}
+_override_service_count = 0
 
 
-def get_logging_service() -> CentralizedLoggingService:
+def get_logging_service(
+    overrides: Optional[Dict[str, Any]] = None,
+    base_dir: Optional[str] = None
+) -> CentralizedLoggingService:
     """
     Get or create global logging service instance
 
+    Args:
+        overrides: Setting values to use instead of the global settings
+            (names from OVERRIDABLE_SETTINGS). Each distinct set of
+            overrides gets its own cached service with separate loggers, so
+            the global settings are never modified.
+        base_dir: Log directory for the overridden service, required with
+            overrides. It must not be the global service's directory: two
+            rotating handlers on one file would each roll it over.
+
     Returns:
-        Global centralized logging service
+        Global centralized logging service, or the service for the overrides
+
+    Raises:
+        ValueError: If an override cannot be applied per service, or
+            base_dir is missing
     """
-    global _logging_service
+    global _logging_service, _override_service_count
+
+    if overrides:
+        unsupported = sorted(set(overrides) - OVERRIDABLE_SETTINGS)
+        if unsupported:
+            raise ValueError(f"Logging settings cannot be overridden: {', '.join(unsupported)}")
+        if base_dir is None:
+            raise ValueError("base_dir is required when overriding logging settings")
+        if os.path.abspath(base_dir) == os.path.abspath(GLOBAL_LOG_DIR):
+            raise ValueError(f"Overridden logging service cannot share {GLOBAL_LOG_DIR!r}")
+
+        key = (
+            os.path.abspath(base_dir),
+            tuple(sorted((name, repr(value)) for name, value in overrides.items()))
+        )
+        service = _override_services.get(key)
+        if service is None:
+            _override_service_count += 1
+            service = CentralizedLoggingService(
+                base_dir=base_dir,
+                use_json=False,
+                enable_redaction=True,
+                enable_console=False,
+                overrides=overrides,
+                logger_prefix=f"abhimata.override{_override_service_count}"
+            )
+            _override_services[key] = service
+        return service
 
     if _logging_service is None:
         _logging_service = CentralizedLoggingService(
-            base_dir="logs",
+            base_dir=GLOBAL_LOG_DIR,
             use_json=False,  # Use text format by default
             enable_redaction=True,  # Enable security features
             enable_console=True  # Log to console as well
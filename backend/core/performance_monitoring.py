@@ -11,20 +11,22 @@ Provides comprehensive performance monitoring including:
 - Automatic logging of performance issues
 """
 
+import os
+import sys
 import time
+import inspect
 import psutil
 import logging
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, Sequence, Tuple
 from datetime import datetime, timedelta
-from collections import defaultdict, deque
-from contextlib import contextmanager
+from collections import deque
 from functools import wraps
 from contextvars import ContextVar
 
 from core.logging_service import get_logging_service, LogType
 
-# Context variable for request timing
-_request_start_time: ContextVar[Optional[float]] = ContextVar('request_start_time', default=None)
+# Context variable for request timing (perf_counter_ns() at request start)
+_request_start_time: ContextVar[Optional[int]] = ContextVar('request_start_time', default=None)
 
 # Performance thresholds (configurable)
 SLOW_REQUEST_THRESHOLD_MS = 1000  # 1 second
@@ -32,6 +34,205 @@ SLOW_QUERY_THRESHOLD_MS = 500     # 500ms
 MEMORY_WARNING_THRESHOLD_MB = 500  # 500MB
 CPU_WARNING_THRESHOLD_PCT = 80    # 80%
 
+# Shortest window CPU usage is measured over. Usage is measured since the
+# previous sample; only samples taken sooner than this wait out the rest.
+CPU_SAMPLE_INTERVAL = 0.1  # seconds
+
+
+class DurationWindow:
+    """
+    The most recent durations, with aggregates kept up to date on append
+
+    Holds the same window as deque(maxlen=...), but count, total, min, max
+    and slow count are maintained incrementally so reading them is O(1):
+    the total and slow count are adjusted for the sample that falls out of
+    the window, and min/max come from monotonic queues of (sequence, value)
+    pairs (amortized O(1) per append).
+    """
+
+    def __init__(self, maxlen: int, slow_threshold_ms: float = float('inf')):
+        """
+        Initialize an empty window
+
+        Args:
+            maxlen: Number of most recent durations to keep
+            slow_threshold_ms: Durations above this count as slow
+        """
+        self.values: deque = deque(maxlen=maxlen)
+        self.slow_threshold_ms = slow_threshold_ms
+        self.total = 0.0
+        self.slow_count = 0
+        self._seq = 0         # Sequence number of the next appended value
+        self._min = deque()   # (seq, value) with increasing values
+        self._max = deque()   # (seq, value) with decreasing values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def append(self, value: float):
+        """Add a duration, dropping the oldest one if the window is full"""
+        values = self.values
+        if len(values) == values.maxlen:
+            evicted = values[0]  # Dropped by the append below
+            self.total -= evicted
+            if evicted > self.slow_threshold_ms:
+                self.slow_count -= 1
+            evicted_seq = self._seq - values.maxlen
+            if self._min[0][0] == evicted_seq:
+                self._min.popleft()
+            if self._max[0][0] == evicted_seq:
+                self._max.popleft()
+
+        values.append(value)
+        self.total += value
+        if value > self.slow_threshold_ms:
+            self.slow_count += 1
+
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((self._seq, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((self._seq, value))
+        self._seq += 1
+
+    def extend(self, values: Sequence[float]):
+        """Add several durations in order"""
+        for value in values:
+            self.append(value)
+
+    def average(self) -> float:
+        """Mean of the window, or 0 when empty"""
+        return self.total / len(self.values) if self.values else 0
+
+    def summary(self) -> Tuple[int, float, float, float, int]:
+        """
+        Aggregates of the window
+
+        Returns:
+            Tuple of (count, total_ms, min_ms, max_ms, slow_count); all zero when empty
+        """
+        if not self.values:
+            return 0, 0.0, 0, 0, 0
+        return len(self.values), self.total, self._min[0][1], self._max[0][1], self.slow_count
+
+
+class ProcSelfReader:
+    """
+    Read this process's resource counters directly from /proc (Linux only)
+
+    /proc/self/stat and /proc/self/io stay open and are re-read with
+    os.pread, so a sample is a handful of reads instead of the separate
+    open/read/close per counter that psutil does.
+    """
+
+    def __init__(self):
+        self.pid = os.getpid()
+        self.stat_fd = os.open('/proc/self/stat', os.O_RDONLY)
+        try:
+            self.io_fd = os.open('/proc/self/io', os.O_RDONLY)
+        except OSError:
+            self.io_fd = None  # Not readable in some containers
+        self.page_size = os.sysconf('SC_PAGE_SIZE')
+        self.clock_ticks = os.sysconf('SC_CLK_TCK')
+
+    def close(self):
+        """Close the /proc file descriptors"""
+        for fd in (self.stat_fd, self.io_fd):
+            if fd is not None:
+                os.close(fd)
+
+    def read_stat(self) -> Tuple[float, int, int]:
+        """
+        Read /proc/self/stat
+
+        Returns:
+            Tuple of (cpu_seconds, num_threads, rss_bytes)
+        """
+        data = os.pread(self.stat_fd, 4096, 0)
+        # The command name may contain spaces; fields after it start at "state"
+        fields = data[data.rindex(b')') + 2:].split()
+        cpu_seconds = (int(fields[11]) + int(fields[12])) / self.clock_ticks  # utime + stime
+        return cpu_seconds, int(fields[17]), int(fields[21]) * self.page_size
+
+    def read_io(self) -> Tuple[int, int]:
+        """
+        Read /proc/self/io
+
+        Returns:
+            Tuple of (read_bytes, write_bytes); zeros if unavailable
+        """
+        if self.io_fd is None:
+            return 0, 0
+
+        counters = {}
+        for line in os.pread(self.io_fd, 1024, 0).splitlines():
+            name, _, value = line.partition(b':')
+            counters[name] = value
+        return int(counters.get(b'read_bytes', 0)), int(counters.get(b'write_bytes', 0))
+
+
+_proc_reader: Optional[ProcSelfReader] = None
+
+
+def get_proc_reader() -> Optional[ProcSelfReader]:
+    """
+    Get the /proc reader for the current process
+
+    Returns:
+        ProcSelfReader, or None when /proc is unavailable (non-Linux)
+    """
+    global _proc_reader
+
+    if not sys.platform.startswith('linux'):
+        return None
+
+    # /proc/self was resolved when the files were opened; reopen after a fork
+    if _proc_reader is None or _proc_reader.pid != os.getpid():
+        try:
+            _proc_reader = ProcSelfReader()
+        except OSError:
+            return None
+
+    return _proc_reader
+
+
+class EndpointStats:
+    """
+    Running request statistics for one endpoint
+
+    Plain attributes (with __slots__) rather than a dict per endpoint, so
+    each recorded request is a few attribute updates instead of string-keyed
+    dict lookups.
+    """
+
+    __slots__ = ('label', 'count', 'total_duration', 'min_duration', 'max_duration', 'errors')
+
+    def __init__(self, label: str):
+        self.label = label  # "METHOD /path" key used in get_statistics
+        self.count = 0
+        self.total_duration = 0.0
+        self.min_duration = float('inf')
+        self.max_duration = 0.0
+        self.errors = 0
+
+
+class EndpointStatsTable(dict):
+    """
+    EndpointStats keyed by (method, endpoint)
+
+    The "METHOD /path" label is formatted and interned once, when an
+    endpoint is first seen, instead of on every statistics read.
+    """
+
+    def __missing__(self, key: Tuple[str, str]) -> EndpointStats:
+        method, endpoint = key
+        stats = self[key] = EndpointStats(sys.intern(f"{method} {endpoint}"))
+        return stats
+
 
 class PerformanceMetrics:
     """
@@ -44,39 +245,40 @@ class PerformanceMetrics:
     - Resource usage monitoring
     """
 
-    def __init__(self, max_history: int = 1000):
+    def __init__(self, max_history: int = 1000, clock: Callable[[], int] = time.perf_counter_ns):
         """
         Initialize performance metrics
 
         Args:
             max_history: Maximum number of metrics to keep in memory
+            clock: Monotonic nanosecond clock used to time tracked blocks
         """
         self.max_history = max_history
+        self.clock = clock
 
         # Request metrics
         self.request_count = 0
-        self.request_durations = deque(maxlen=max_history)
-        self.endpoint_stats = defaultdict(lambda: {
-            'count': 0,
-            'total_duration': 0.0,
-            'min_duration': float('inf'),
-            'max_duration': 0.0,
-            'errors': 0
-        })
+        self.request_durations = DurationWindow(max_history, SLOW_REQUEST_THRESHOLD_MS)
+        self.endpoint_stats = EndpointStatsTable()
 
         # Database metrics
         self.query_count = 0
-        self.query_durations = deque(maxlen=max_history)
+        self.query_durations = DurationWindow(max_history, SLOW_QUERY_THRESHOLD_MS)
         self.slow_queries = deque(maxlen=100)
 
-        # WebSocket metrics
+        # WebSocket metrics. Plain ints with no lock: updates come from
+        # coroutines on the event loop thread, which never interleave
+        # mid-increment, so atomics would add cost without adding safety.
         self.websocket_connections = 0
         self.websocket_messages_sent = 0
         self.websocket_messages_received = 0
-        self.websocket_latencies = deque(maxlen=max_history)
+        self.websocket_latencies = DurationWindow(max_history)
 
         # Resource metrics (sampled periodically)
         self.resource_samples = deque(maxlen=max_history)
+        self._process: Optional[psutil.Process] = None
+        self._last_cpu_seconds = self._cpu_seconds()
+        self._last_cpu_wall = time.perf_counter()
 
         # Logging service
         self.logger = get_logging_service()
@@ -104,27 +306,86 @@ class PerformanceMetrics:
         self.request_durations.append(duration_ms)
 
         # Update endpoint stats
-        key = f"{method} {endpoint}"
-        stats = self.endpoint_stats[key]
-        stats['count'] += 1
-        stats['total_duration'] += duration_ms
-        stats['min_duration'] = min(stats['min_duration'], duration_ms)
-        stats['max_duration'] = max(stats['max_duration'], duration_ms)
+        stats = self.endpoint_stats[(method, endpoint)]
+        stats.count += 1
+        stats.total_duration += duration_ms
+        if duration_ms < stats.min_duration:
+            stats.min_duration = duration_ms
+        if duration_ms > stats.max_duration:
+            stats.max_duration = duration_ms
         if error:
-            stats['errors'] += 1
+            stats.errors += 1
 
         # Log slow requests
         if duration_ms > SLOW_REQUEST_THRESHOLD_MS:
-            self.logger.performance(
-                f"Slow request detected: {key} took {duration_ms:.2f}ms (status: {status_code})",
-                extra_data={
-                    'endpoint': endpoint,
-                    'method': method,
-                    'duration_ms': duration_ms,
-                    'status_code': status_code,
-                    'threshold_ms': SLOW_REQUEST_THRESHOLD_MS
-                }
+            self._log_slow_request(endpoint, method, duration_ms, status_code)
+
+    def record_requests_bulk(
+        self,
+        endpoint: str,
+        method: str,
+        durations: Sequence[float],
+        status_codes: Sequence[int],
+        errors: Optional[Sequence[bool]] = None
+    ):
+        """
+        Record several requests to one endpoint in a single update
+
+        Equivalent to calling record_request once per sample, but the
+        endpoint entry is looked up once and the counters are updated
+        with aggregates.
+
+        Args:
+            endpoint: API endpoint path
+            method: HTTP method (GET, POST, etc.)
+            durations: Request durations in seconds
+            status_codes: HTTP status code of each request
+            errors: Whether each request resulted in error (default: none did)
+
+        Raises:
+            ValueError: If status_codes or errors is not the same length as durations
+        """
+        if len(status_codes) != len(durations):
+            raise ValueError(
+                f"Got {len(status_codes)} status codes for {len(durations)} durations"
             )
+        if errors is not None and len(errors) != len(durations):
+            raise ValueError(f"Got {len(errors)} error flags for {len(durations)} durations")
+        if len(durations) == 0:
+            return
+
+        durations_ms = [duration * 1000 for duration in durations]
+        self.request_count += len(durations_ms)
+        self.request_durations.extend(durations_ms)
+
+        # Update endpoint stats
+        stats = self.endpoint_stats[(method, endpoint)]
+        stats.count += len(durations_ms)
+        stats.total_duration += sum(durations_ms)
+        batch_max = max(durations_ms)
+        stats.min_duration = min(stats.min_duration, min(durations_ms))
+        stats.max_duration = max(stats.max_duration, batch_max)
+        if errors is not None:
+            stats.errors += sum(1 for error in errors if error)
+
+        # Log slow requests
+        if batch_max > SLOW_REQUEST_THRESHOLD_MS:
+            for duration_ms, status_code in zip(durations_ms, status_codes):
+                if duration_ms > SLOW_REQUEST_THRESHOLD_MS:
+                    self._log_slow_request(endpoint, method, duration_ms, status_code)
+
+    def _log_slow_request(self, endpoint: str, method: str, duration_ms: float, status_code: int):
+        """Log a request that exceeded SLOW_REQUEST_THRESHOLD_MS"""
+        self.logger.performance(
+            f"Slow request detected: {method} {endpoint} took {duration_ms:.2f}ms (status: {status_code})",
+            extra_data={
+                'endpoint': endpoint,
+                'method': method,
+                'duration_ms': duration_ms,
+                'status_code': status_code,
+                'threshold_ms': SLOW_REQUEST_THRESHOLD_MS
+            }
+        )
 
     def record_query(
         self,
@@ -204,31 +465,74 @@ class PerformanceMetrics:
                     extra_data={'latency_ms': latency_ms}
                 )
 
+    def _cpu_seconds(self) -> float:
+        """Process CPU time (user + system) in seconds"""
+        reader = get_proc_reader()
+        if reader is not None:
+            return reader.read_stat()[0]
+
+        if self._process is None:
+            self._process = psutil.Process()
+        cpu_times = self._process.cpu_times()
+        return cpu_times.user + cpu_times.system
+
+    def _wait_for_cpu_window(self):
+        """Sleep out whatever remains of CPU_SAMPLE_INTERVAL since the previous CPU sample"""
+        elapsed = time.perf_counter() - self._last_cpu_wall
+        if elapsed < CPU_SAMPLE_INTERVAL:
+            time.sleep(CPU_SAMPLE_INTERVAL - elapsed)
+
+    def _cpu_percent(self, cpu_seconds: float) -> float:
+        """
+        CPU usage (percent) since the previous sample (or since creation)
+
+        Args:
+            cpu_seconds: Process CPU time, read after _wait_for_cpu_window
+
+        Returns:
+            CPU percent over at least CPU_SAMPLE_INTERVAL seconds
+        """
+        wall = time.perf_counter()
+        cpu_percent = (cpu_seconds - self._last_cpu_seconds) / (wall - self._last_cpu_wall) * 100
+        self._last_cpu_seconds = cpu_seconds
+        self._last_cpu_wall = wall
+        return cpu_percent
+
     def sample_resource_usage(self):
         """
         Sample current resource usage (memory, CPU, etc.)
         """
         try:
-            process = psutil.Process()
-
-            # Memory info
-            memory_info = process.memory_info()
-            memory_mb = memory_info.rss / (1024 * 1024)  # Convert to MB
-
-            # CPU usage (percent)
-            cpu_percent = process.cpu_percent(interval=0.1)
-
-            # Disk I/O (if available)
-            try:
-                io_counters = process.io_counters()
-                disk_read_mb = io_counters.read_bytes / (1024 * 1024)
-                disk_write_mb = io_counters.write_bytes / (1024 * 1024)
-            except (AttributeError, OSError):
-                disk_read_mb = 0
-                disk_write_mb = 0
-
-            # Thread count
-            num_threads = process.num_threads()
+            reader = get_proc_reader()
+            self._wait_for_cpu_window()
+
+            if reader is not None:
+                # A single /proc/self/stat read gives CPU time, threads and RSS
+                cpu_seconds, num_threads, rss_bytes = reader.read_stat()
+                cpu_percent = self._cpu_percent(cpu_seconds)
+                memory_mb = rss_bytes / (1024 * 1024)  # Convert to MB
+                read_bytes, write_bytes = reader.read_io()
+                disk_read_mb = read_bytes / (1024 * 1024)
+                disk_write_mb = write_bytes / (1024 * 1024)
+            else:
+                cpu_percent = self._cpu_percent(self._cpu_seconds())
+                process = self._process
+
+                # Memory info
+                memory_info = process.memory_info()
+                memory_mb = memory_info.rss / (1024 * 1024)  # Convert to MB
+
+                # Disk I/O (if available)
+                try:
+                    io_counters = process.io_counters()
+                    disk_read_mb = io_counters.read_bytes / (1024 * 1024)
+                    disk_write_mb = io_counters.write_bytes / (1024 * 1024)
+                except (AttributeError, OSError):
+                    disk_read_mb = 0
+                    disk_write_mb = 0
+
+                # Thread count
+                num_threads = process.num_threads()
 
             sample = {
                 'timestamp': datetime.now(),
@@ -269,38 +573,40 @@ class PerformanceMetrics:
         Returns:
             Dictionary with performance statistics
         """
+        count, total, min_ms, max_ms, slow_count = self.request_durations.summary()
+
         stats = {
             'requests': {
                 'total_count': self.request_count,
-                'avg_duration_ms': sum(self.request_durations) / len(self.request_durations) if self.request_durations else 0,
-                'min_duration_ms': min(self.request_durations) if self.request_durations else 0,
-                'max_duration_ms': max(self.request_durations) if self.request_durations else 0,
-                'slow_requests': sum(1 for d in self.request_durations if d > SLOW_REQUEST_THRESHOLD_MS)
+                'avg_duration_ms': total / count if count else 0,
+                'min_duration_ms': min_ms,
+                'max_duration_ms': max_ms,
+                'slow_requests': slow_count
             },
             'endpoints': {},
             'queries': {
                 'total_count': self.query_count,
-                'avg_duration_ms': sum(self.query_durations) / len(self.query_durations) if self.query_durations else 0,
+                'avg_duration_ms': self.query_durations.average(),
                 'slow_queries': len(self.slow_queries)
             },
             'websockets': {
                 'active_connections': self.websocket_connections,
                 'messages_sent': self.websocket_messages_sent,
                 'messages_received': self.websocket_messages_received,
-                'avg_latency_ms': sum(self.websocket_latencies) / len(self.websocket_latencies) if self.websocket_latencies else 0
+                'avg_latency_ms': self.websocket_latencies.average()
             },
             'resources': {}
         }
 
         # Calculate endpoint statistics
-        for endpoint, data in self.endpoint_stats.items():
-            if data['count'] > 0:
-                stats['endpoints'][endpoint] = {
-                    'count': data['count'],
-                    'avg_duration_ms': data['total_duration'] / data['count'],
-                    'min_duration_ms': data['min_duration'],
-                    'max_duration_ms': data['max_duration'],
-                    'error_rate': data['errors'] / data['count'] if data['count'] > 0 else 0
+        for data in self.endpoint_stats.values():
+            if data.count > 0:
+                stats['endpoints'][data.label] = {
+                    'count': data.count,
+                    'avg_duration_ms': data.total_duration / data.count,
+                    'min_duration_ms': data.min_duration,
+                    'max_duration_ms': data.max_duration,
+                    'error_rate': data.errors / data.count
                 }
 
         # Calculate resource statistics
@@ -316,7 +622,7 @@ class PerformanceMetrics:
 
     def reset(self):
         """Reset all metrics"""
-        self.__init__(max_history=self.max_history)
+        self.__init__(max_history=self.max_history, clock=self.clock)
 
 
 # Global performance metrics instance
@@ -339,8 +645,44 @@ def get_performance_metrics() -> PerformanceMetrics:
 
 
 # Context managers and decorators
-@contextmanager
-def track_request_time(endpoint: str, method: str = "GET"):
+class RequestTimer:
+    """
+    Context manager returned by track_request_time
+
+    A small slotted class rather than a @contextmanager generator, so
+    entering and leaving costs two method calls instead of creating a
+    generator and its wrapper on every tracked request or decorated call.
+    """
+
+    __slots__ = ('endpoint', 'method', 'metrics', 'clock', 'start_time')
+
+    def __init__(self, endpoint: str, method: str, metrics: PerformanceMetrics):
+        self.endpoint = endpoint
+        self.method = method
+        self.metrics = metrics
+        # Monotonic, integer-valued clock (perf_counter_ns by default):
+        # unaffected by wall-clock adjustments and read through the vDSO on Linux
+        self.clock = metrics.clock
+
+    def __enter__(self):
+        self.start_time = self.clock()
+        _request_start_time.set(self.start_time)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        duration = (self.clock() - self.start_time) / 1e9
+        error = exc_type is not None and issubclass(exc_type, Exception)
+        status_code = 500 if error else 200
+        self.metrics.record_request(self.endpoint, self.method, duration, status_code, error)
+        _request_start_time.set(None)
+        return False  # Never suppress the exception
+
+
+def track_request_time(
+    endpoint: str,
+    method: str = "GET",
+    metrics: Optional[PerformanceMetrics] = None
+) -> RequestTimer:
     """
     Context manager to track request execution time
 
@@ -352,27 +694,39 @@ def track_request_time(endpoint: str, method: str = "GET"):
     Args:
         endpoint: API endpoint path
         method: HTTP method
+        metrics: Metrics to record into (uses global if not provided)
     """
-    metrics = get_performance_metrics()
-    start_time = time.time()
-    _request_start_time.set(start_time)
-    error = False
-    status_code = 200
-
-    try:
-        yield
-    except Exception as e:
-        error = True
-        status_code = 500
-        raise
-    finally:
-        duration = time.time() - start_time
-        metrics.record_request(endpoint, method, duration, status_code, error)
-        _request_start_time.set(None)
+    if metrics is None:
+        metrics = get_performance_metrics()
+    return RequestTimer(endpoint, method, metrics)
+
 
+class QueryTimer:
+    """Context manager returned by track_query_time (slotted, like RequestTimer)"""
 
-@contextmanager
-def track_query_time(query_type: str, query_text: Optional[str] = None):
+    __slots__ = ('query_type', 'query_text', 'metrics', 'clock', 'start_time')
+
+    def __init__(self, query_type: str, query_text: Optional[str], metrics: PerformanceMetrics):
+        self.query_type = query_type
+        self.query_text = query_text
+        self.metrics = metrics
+        self.clock = metrics.clock
+
+    def __enter__(self):
+        self.start_time = self.clock()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        duration = (self.clock() - self.start_time) / 1e9
+        self.metrics.record_query(self.query_type, duration, self.query_text)
+        return False  # Never suppress the exception
+
+
+def track_query_time(
+    query_type: str,
+    query_text: Optional[str] = None,
+    metrics: Optional[PerformanceMetrics] = None
+) -> QueryTimer:
     """
     Context manager to track database query execution time
 
@@ -384,18 +738,14 @@ def track_query_time(query_type: str, query_text: Optional[str] = None):
     Args:
         query_type: Type of query (SELECT, INSERT, etc.)
         query_text: SQL query text (optional)
+        metrics: Metrics to record into (uses global if not provided)
     """
-    metrics = get_performance_metrics()
-    start_time = time.time()
+    if metrics is None:
+        metrics = get_performance_metrics()
+    return QueryTimer(query_type, query_text, metrics)
 
-    try:
-        yield
-    finally:
-        duration = time.time() - start_time
-        metrics.record_query(query_type, duration, query_text)
 
-
-def monitor_performance(endpoint: Optional[str] = None):
+def monitor_performance(endpoint: Optional[str] = None, metrics: Optional[PerformanceMetrics] = None):
     """
     Decorator to monitor function performance
 
@@ -406,32 +756,26 @@ def monitor_performance(endpoint: Optional[str] = None):
 
     Args:
         endpoint: Endpoint path (uses function name if not provided)
+        metrics: Metrics to record into (uses global if not provided)
     """
     def decorator(func: Callable):
-        @wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            nonlocal endpoint
-            if endpoint is None:
-                endpoint = func.__name__
+        # Resolved once here rather than on every call
+        name = endpoint if endpoint is not None else func.__name__
 
-            with track_request_time(endpoint, "FUNC"):
-                return await func(*args, **kwargs)
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with track_request_time(name, "FUNC", metrics):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
 
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
-            nonlocal endpoint
-            if endpoint is None:
-                endpoint = func.__name__
-
-            with track_request_time(endpoint, "FUNC"):
+            with track_request_time(name, "FUNC", metrics):
                 return func(*args, **kwargs)
 
-        # Return appropriate wrapper based on function type
-        import inspect
-        if inspect.iscoroutinefunction(func):
-            return async_wrapper
-        else:
-            return sync_wrapper
+        return sync_wrapper
 
     return decorator
 
@@ -41,7 +41,13 @@ class Participant(SQLModel, table=True):
         Formula: (Handicap Index × Slope Rating) / 113
         Returns rounded integer value
         """
-        if self.teebox and self.teebox.slope_rating:
-            return round((self.declared_handicap * self.teebox.slope_rating) / 113.0)
+        slope_rating = self.teebox.slope_rating if self.teebox else None
+        return self.calculate_course_handicap(self.declared_handicap, slope_rating)
+
+    @staticmethod
+    def calculate_course_handicap(declared_handicap: float, slope_rating: Optional[int]) -> int:
+        """Course handicap from raw values, for callers that don't load the ORM object"""
+        if slope_rating:
+            return round((declared_handicap * slope_rating) / 113.0)
         # Fallback to declared handicap if no teebox assigned
-        return round(self.declared_handicap)
+        return round(declared_handicap)
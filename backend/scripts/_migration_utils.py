@@ -0,0 +1,51 @@
+"""
+Shared helpers for the SQLite migration scripts in this directory.
+"""
+
+import sqlite3
+
+# Connection PRAGMAs applied before any migration statement runs. Only
+# per-connection settings belong here: journal_mode=WAL would be stored in
+# the database file and change it for the app as well. A 64MB in-memory
+# page cache avoids re-reading pages during ALTER TABLE.
+CONNECTION_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+)
+
+
+def open_connection(db_path: str, isolation_level: str | None = "") -> sqlite3.Connection:
+    """Open a SQLite connection tuned for running migrations"""
+    conn = sqlite3.connect(db_path, isolation_level=isolation_level)
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def get_columns(cursor: sqlite3.Cursor, table: str) -> set[str]:
+    """Return the set of column names for a table using a single PRAGMA call"""
+    return {row[1] for row in cursor.execute(f"PRAGMA table_info({table})")}
+
+
+def has_column(cursor: sqlite3.Cursor, table: str, column: str) -> bool:
+    """Check for a single column, letting SQLite stop at the first match"""
+    return cursor.execute(
+        "SELECT 1 FROM pragma_table_info(?) WHERE name = ? LIMIT 1", (table, column)
+    ).fetchone() is not None
+
+
+def existing_columns(cursor: sqlite3.Cursor, table: str, columns: tuple[str, ...]) -> set[str]:
+    """Return which of the given columns already exist in a table"""
+    placeholders = ", ".join("?" * len(columns))
+    return {
+        row[0] for row in cursor.execute(
+            f"SELECT name FROM pragma_table_info(?) WHERE name IN ({placeholders})",
+            (table, *columns),
+        )
+    }
+
+
+def optimize(conn: sqlite3.Connection) -> None:
+    """Refresh query planner statistics after a schema change (cheap when nothing changed)"""
+    conn.execute("PRAGMA analysis_limit=1000")
+    conn.execute("PRAGMA optimize")
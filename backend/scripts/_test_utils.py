@@ -0,0 +1,27 @@
+"""
+Shared helpers for the test scripts in this directory.
+"""
+
+import io
+import threading
+
+
+class ThreadCapturedStdout(io.TextIOBase):
+    """
+    sys.stdout replacement that routes each thread's prints to its own buffer
+
+    contextlib.redirect_stdout swaps the process-wide stream, so it cannot
+    keep concurrently running tests apart; threads without a buffer write
+    straight through.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self.local, 'buffer', None)
+        return (buffer or self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
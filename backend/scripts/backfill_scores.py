@@ -34,6 +34,9 @@ from models.course import Hole
 from services.scoring_strategies import ScoringStrategyFactory
 from core.app_logging import logger
 
+# Number of scorecards processed between progress updates
+PROGRESS_INTERVAL = 500
+
 
 class ScoreBackfiller:
     """Backfills existing scorecards with calculated values"""
@@ -72,10 +75,8 @@ class ScoreBackfiller:
                 return
 
             # Process each scorecard
+            total = len(scorecards)
             for i, scorecard in enumerate(scorecards, 1):
-                if self.verbose or i % 10 == 0:
-                    print(f"Processing {i}/{len(scorecards)}...", end='\r')
-
                 try:
                     self._process_scorecard(session, scorecard)
                 except Exception as e:
@@ -84,6 +85,10 @@ class ScoreBackfiller:
                     if self.verbose:
                         print(f"\n[ERROR] Error on scorecard {scorecard.id}: {e}")
 
+                if i % PROGRESS_INTERVAL == 0 or i == total:
+                    sys.stdout.write(f"Processing {i}/{total}...\r")
+                    sys.stdout.flush()
+
             # Commit changes if not dry run
             if not self.dry_run:
                 session.commit()
@@ -148,12 +153,13 @@ class ScoreBackfiller:
                 print(f"   Strokes: {scorecard.strokes}")
                 print(f"   Net Score: {old_net_score} -> {scorecard.net_score}")
                 print(f"   Points: {old_points} -> {scorecard.points}")
+
+            # Update in session (will be committed/rolled back later)
+            session.add(scorecard)
         else:
+            # Nothing changed - keep the row out of the session's dirty set
             self.stats['skipped'] += 1
 
-        # Update in session (will be committed/rolled back later)
-        session.add(scorecard)
-
     def _print_summary(self):
         """Print backfill summary"""
         print(f"\n{'='*60}")
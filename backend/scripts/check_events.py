@@ -6,7 +6,7 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from sqlmodel import Session, select
+from sqlmodel import Session, select, func
 from core.database import engine
 from models.event import Event
 from models.participant import Participant
@@ -25,14 +25,14 @@ with Session(engine) as session:
     else:
         for e in events:
             # Count participants
-            p_count = len(session.exec(
-                select(Participant).where(Participant.event_id == e.id)
-            ).all())
+            p_count = session.exec(
+                select(func.count()).select_from(Participant).where(Participant.event_id == e.id)
+            ).one()
 
             # Count divisions
-            d_count = len(session.exec(
-                select(EventDivision).where(EventDivision.event_id == e.id)
-            ).all())
+            d_count = session.exec(
+                select(func.count()).select_from(EventDivision).where(EventDivision.event_id == e.id)
+            ).one()
 
             print(f"\nEvent ID: {e.id}")
             print(f"  Name: {e.name}")
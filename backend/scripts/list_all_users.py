@@ -10,6 +10,12 @@ from sqlmodel import Session, select
 from core.database import engine
 from models.user import User
 
+# Rows fetched per round trip and written to stdout per write
+BATCH_SIZE = 500
+
+# Fixed-width layout shared by the header and every user row
+ROW_FORMAT = "{:<5} {:<30} {:<35} {:<15} {}\n"
+
 def list_all_users():
     """List all users in the database"""
 
@@ -18,22 +24,40 @@ def list_all_users():
     print("="*70)
 
     with Session(engine) as session:
-        users = session.exec(select(User)).all()
-
-        if not users:
+        # Stream only the displayed columns in batches instead of loading User objects
+        statement = select(
+            User.id, User.full_name, User.email, User.role, User.is_active
+        ).execution_options(yield_per=BATCH_SIZE)
+
+        # Rows are buffered and written to stdout once per batch
+        lines = [
+            "\n",
+            ROW_FORMAT.format('ID', 'Full Name', 'Email', 'Role', 'Active'),
+            "-" * 70 + "\n",
+        ]
+        total = 0
+
+        # Bind hot-loop callables to locals
+        format_row = ROW_FORMAT.format
+        append = lines.append
+        write = sys.stdout.write
+
+        for user_id, full_name, email, role, is_active in session.exec(statement):
+            append(format_row(user_id, full_name, email, role.value, "Yes" if is_active else "No"))
+            total += 1
+
+            if len(lines) >= BATCH_SIZE:
+                write("".join(lines))
+                lines.clear()
+
+        if total == 0:
             print("\nNo users found in database!")
             return
 
-        print(f"\nTotal Users: {len(users)}\n")
-        print(f"{'ID':<5} {'Full Name':<30} {'Email':<35} {'Role':<15} {'Active'}")
-        print("-" * 70)
-
-        for user in users:
-            active_str = "Yes" if user.is_active else "No"
-            print(f"{user.id:<5} {user.full_name:<30} {user.email:<35} {user.role.value:<15} {active_str}")
+        write("".join(lines))
 
+        print(f"\nTotal Users: {total}")
         print("\n" + "="*70 + "\n")
 
-
 if __name__ == "__main__":
     list_all_users()
@@ -9,6 +9,7 @@ These fields support System 36 Modified validation where participants
 may be reassigned to different divisions based on calculated handicap.
 """
 
+import argparse
 import sqlite3
 import sys
 import os
@@ -17,19 +18,23 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from core.config import settings
+from scripts._migration_utils import existing_columns, get_columns, open_connection, optimize
 
 
-def migrate():
+def migrate(verify: bool = True):
     """Add division reassignment tracking fields to winner_result table"""
 
-    # Connect to database
-    conn = sqlite3.connect(settings.database_url.replace('sqlite:///', ''))
+    # Connect to database (autocommit mode, transaction is controlled explicitly)
+    conn = open_connection(settings.database_url.replace('sqlite:///', ''), isolation_level=None)
     cursor = conn.cursor()
 
     print("MIGRATION: Add division reassignment tracking to winner_result table")
     print("=" * 80)
 
     try:
+        # Take the write lock up front so introspection and ALTERs are atomic
+        cursor.execute("BEGIN IMMEDIATE")
+
         # Check if table exists
         cursor.execute("""
             SELECT name FROM sqlite_master
@@ -40,13 +45,13 @@ def migrate():
             print("[ERROR] Table 'winnerresult' does not exist")
             return
 
-        # Get current columns
-        cursor.execute("PRAGMA table_info(winnerresult)")
-        columns = [col[1] for col in cursor.fetchall()]
-        print(f"Current columns in winnerresult: {', '.join(columns)}")
-        print()
+        # Check which of the new columns already exist
+        columns = existing_columns(cursor, 'winnerresult', ('original_division_id', 'division_reassigned'))
+
+        if verify:
+            print(f"Current columns in winnerresult: {', '.join(sorted(get_columns(cursor, 'winnerresult')))}")
+            print()
 
-        # Check if columns already exist
         if 'original_division_id' in columns and 'division_reassigned' in columns:
             print("[OK] Columns 'original_division_id' and 'division_reassigned' already exist")
             return
@@ -74,24 +79,34 @@ def migrate():
             print("[OK] Column 'division_reassigned' already exists")
 
         # Commit changes
-        conn.commit()
+        cursor.execute("COMMIT")
+        optimize(conn)
         print()
         print("=" * 80)
         print("[SUCCESS] Migration completed successfully")
 
         # Verify columns were added
-        cursor.execute("PRAGMA table_info(winnerresult)")
-        columns = [col[1] for col in cursor.fetchall()]
-        print(f"Updated columns in winnerresult: {', '.join(columns)}")
+        if verify:
+            columns = get_columns(cursor, 'winnerresult')
+            print(f"Updated columns in winnerresult: {', '.join(sorted(columns))}")
 
     except sqlite3.Error as e:
         print(f"[ERROR] Database error: {e}")
-        conn.rollback()
+        if conn.in_transaction:
+            cursor.execute("ROLLBACK")
         raise
     finally:
+        # Release the lock on early exits (nothing was altered)
+        if conn.in_transaction:
+            cursor.execute("ROLLBACK")
         cursor.close()
         conn.close()
 
 
 if __name__ == "__main__":
-    migrate()
+    parser = argparse.ArgumentParser(description='Add division reassignment tracking fields')
+    parser.add_argument('--no-verify', dest='verify', action='store_false',
+                        help='Skip re-reading the table schema after migrating')
+    args = parser.parse_args()
+
+    migrate(verify=args.verify)
@@ -5,6 +5,7 @@ This migration adds the system36_variant column to the event table.
 Default value is 'standard' for existing events.
 """
 
+import argparse
 import sys
 import os
 
@@ -13,9 +14,9 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from sqlmodel import Session
 from core.database import engine
-import sqlite3
+from scripts._migration_utils import has_column, open_connection, optimize
 
-def migrate():
+def migrate(verify: bool = True):
     """Add system36_variant column to event table"""
 
     print("\n" + "="*60)
@@ -27,14 +28,11 @@ def migrate():
 
     try:
         # Connect directly to SQLite
-        conn = sqlite3.connect(db_path)
+        conn = open_connection(db_path)
         cursor = conn.cursor()
 
         # Check if column already exists
-        cursor.execute("PRAGMA table_info(event)")
-        columns = [col[1] for col in cursor.fetchall()]
-
-        if 'system36_variant' in columns:
+        if has_column(cursor, 'event', 'system36_variant'):
             print("[OK] Column 'system36_variant' already exists in event table")
             print("    No migration needed.")
             conn.close()
@@ -52,21 +50,19 @@ def migrate():
         print("[OK] Column added successfully")
 
         # Verify the column was added
-        cursor.execute("PRAGMA table_info(event)")
-        columns = [col[1] for col in cursor.fetchall()]
-
-        if 'system36_variant' in columns:
+        if verify:
+            if not has_column(cursor, 'event', 'system36_variant'):
+                print("[ERROR] Column was not added!")
+                conn.close()
+                return False
             print("[OK] Migration verified - column exists")
 
-            # Count existing events
-            cursor.execute("SELECT COUNT(*) FROM event")
-            count = cursor.fetchone()[0]
-            print(f"[OK] {count} existing event(s) will use default value 'STANDARD'")
-        else:
-            print("[ERROR] Column was not added!")
-            conn.close()
-            return False
+        # Count existing events
+        cursor.execute("SELECT COUNT(*) FROM event")
+        count = cursor.fetchone()[0]
+        print(f"[OK] {count} existing event(s) will use default value 'STANDARD'")
 
+        optimize(conn)
         conn.close()
 
         print("\n" + "="*60)
@@ -83,5 +79,10 @@ def migrate():
 
 
 if __name__ == "__main__":
-    success = migrate()
+    parser = argparse.ArgumentParser(description='Add system36_variant column to event table')
+    parser.add_argument('--no-verify', dest='verify', action='store_false',
+                        help='Skip re-reading the table schema after migrating')
+    args = parser.parse_args()
+
+    success = migrate(verify=args.verify)
     sys.exit(0 if success else 1)
@@ -6,13 +6,14 @@ Adds:
 - use_course_handicap_for_assignment (BOOLEAN)
 """
 
+import argparse
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import sqlite3
+from scripts._migration_utils import existing_columns, get_columns, open_connection, optimize
 
-def migrate():
+def migrate(verify: bool = True):
     """Add missing columns to eventdivision table"""
 
     print("\n" + "="*60)
@@ -20,16 +21,20 @@ def migrate():
     print("="*60 + "\n")
 
     db_path = "backend/data/golf_tournament.db"
-    conn = sqlite3.connect(db_path)
+    # Autocommit mode so the transaction below is controlled explicitly
+    conn = open_connection(db_path, isolation_level=None)
     cursor = conn.cursor()
 
     try:
-        # Check existing columns
-        cursor.execute("PRAGMA table_info(eventdivision)")
-        columns = [col[1] for col in cursor.fetchall()]
+        # Take the write lock up front so introspection and ALTERs are atomic
+        cursor.execute("BEGIN IMMEDIATE")
 
-        print("Current columns:", columns)
-        print()
+        # Check which of the new columns already exist
+        columns = existing_columns(cursor, 'eventdivision', ('division_type', 'use_course_handicap_for_assignment'))
+
+        if verify:
+            print("Current columns:", sorted(get_columns(cursor, 'eventdivision')))
+            print()
 
         # Add division_type if missing
         if 'division_type' not in columns:
@@ -53,13 +58,13 @@ def migrate():
         else:
             print("[OK] Column 'use_course_handicap_for_assignment' already exists")
 
-        conn.commit()
+        cursor.execute("COMMIT")
+        optimize(conn)
 
         # Verify
-        cursor.execute("PRAGMA table_info(eventdivision)")
-        columns = [col[1] for col in cursor.fetchall()]
-
-        print("\nUpdated columns:", columns)
+        if verify:
+            columns = get_columns(cursor, 'eventdivision')
+            print("\nUpdated columns:", sorted(columns))
 
         print("\n" + "="*60)
         print("MIGRATION COMPLETED")
@@ -72,10 +77,17 @@ def migrate():
         print(f"\n[ERROR] Migration failed: {e}")
         import traceback
         traceback.print_exc()
+        if conn.in_transaction:
+            cursor.execute("ROLLBACK")
         conn.close()
         return False
 
 
 if __name__ == "__main__":
-    success = migrate()
+    parser = argparse.ArgumentParser(description='Add missing columns to eventdivision table')
+    parser.add_argument('--no-verify', dest='verify', action='store_false',
+                        help='Skip re-reading the table schema after migrating')
+    args = parser.parse_args()
+
+    success = migrate(verify=args.verify)
     sys.exit(0 if success else 1)
@@ -1,6 +1,11 @@
 """
 Migration script to update WinnerResult table schema
 Makes overall_rank nullable to support division-only winners
+
+SQLite cannot change a column's nullability in place, so the table is
+rebuilt inside a single transaction: the old table is renamed, the new
+schema is created from the model, existing rows are copied across and
+the old table is dropped. Existing winner results are preserved.
 """
 
 import sys
@@ -9,36 +14,72 @@ import os
 # Add backend directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from sqlmodel import Session, text
+from sqlmodel import text
 from core.database import engine
+from models.winner_result import WinnerResult
+from scripts._migration_utils import optimize
 
 
 def migrate():
-    """Drop and recreate winnerresult table with updated schema"""
+    """Rebuild winnerresult table with nullable overall_rank, keeping existing rows"""
+
+    table = WinnerResult.__table__
+
+    try:
+        with engine.begin() as conn:
+            # pysqlite only opens a transaction before DML, so the DDL below
+            # would autocommit; take the write lock explicitly so the whole
+            # rebuild rolls back on failure
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+            columns = {
+                row[1]: row for row in conn.execute(text("PRAGMA table_info(winnerresult)"))
+            }
+            overall_rank = columns.get('overall_rank')
+
+            if not columns:
+                print("Table winnerresult does not exist, creating it...")
+                table.create(conn)
+                print("[OK] Table created successfully")
+            elif overall_rank is not None and not overall_rank[3]:
+                print("[OK] overall_rank is already nullable, no migration needed")
+                return True
+            else:
+                if overall_rank is None:
+                    print("Column overall_rank is missing from winnerresult, "
+                          "the rebuild adds it as nullable")
+                # Copy every column that exists in both the old and new schema
+                copy_columns = ", ".join(
+                    column.name for column in table.columns if column.name in columns
+                )
 
-    with Session(engine) as session:
+                print("Rebuilding winnerresult table...")
+                for index in table.indexes:
+                    conn.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+                conn.execute(text("ALTER TABLE winnerresult RENAME TO winnerresult_old"))
+                table.create(conn)
+                result = conn.execute(text(
+                    f"INSERT INTO winnerresult ({copy_columns}) "
+                    f"SELECT {copy_columns} FROM winnerresult_old"
+                ))
+                conn.execute(text("DROP TABLE winnerresult_old"))
+                print(f"[OK] Table rebuilt, {result.rowcount} existing row(s) preserved")
+
+        # Refresh query planner statistics for the new schema
+        raw_conn = engine.raw_connection()
         try:
-            print("Dropping winnerresult table...")
-            session.exec(text("DROP TABLE IF EXISTS winnerresult"))
-            session.commit()
-            print("[OK] Table dropped successfully")
-
-            # Now recreate the table by importing the model and creating it
-            from core.database import create_db_and_tables
-            print("Recreating tables with new schema...")
-            create_db_and_tables()
-            print("[OK] Tables recreated successfully")
-
-            print("\n[SUCCESS] Migration completed!")
-            print("   - winnerresult table now has nullable overall_rank")
-            print("   - Ready for division-based winner calculation")
-
-        except Exception as e:
-            print(f"[ERROR] Migration failed: {e}")
-            import traceback
-            traceback.print_exc()
-            session.rollback()
-            return False
+            optimize(raw_conn.driver_connection)
+        finally:
+            raw_conn.close()
+
+        print("\n[SUCCESS] Migration completed!")
+        print("   - winnerresult table now has nullable overall_rank")
+        print("   - Ready for division-based winner calculation")
+
+    except Exception as e:
+        print(f"[ERROR] Migration failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
 
     return True
 
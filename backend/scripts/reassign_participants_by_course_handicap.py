@@ -13,13 +13,29 @@ This script:
 
 import sys
 import os
+from bisect import bisect_right
+from collections import defaultdict
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from sqlmodel import Session, select
+from sqlmodel import Session, select, update
 from core.database import engine
 from models.event import Event, ScoringType, System36Variant
 from models.event_division import EventDivision
 from models.participant import Participant
+from models.course import Teebox
+
+
+def find_division(division_ranges, range_starts, course_hcp):
+    """Return the first (min, max, id, name) range containing course_hcp, or None
+
+    division_ranges is sorted by handicap_min and range_starts holds those
+    minimums, so only ranges starting at or below course_hcp are checked.
+    """
+    for division_range in division_ranges[:bisect_right(range_starts, course_hcp)]:
+        if course_hcp <= division_range[1]:
+            return division_range
+    return None
+
 
 def reassign_participants(event_id: int = None):
     """Reassign participants based on course handicap"""
@@ -49,31 +65,65 @@ def reassign_participants(event_id: int = None):
             print("[INFO] No events to process")
             return True
 
-        total_reassigned = 0
+        event_ids = [event.id for event in events]
+
+        # Prefetch divisions that use course handicap for all events at once,
+        # as plain (min, max, id, name) tuples rather than ORM objects
+        divisions_by_event = defaultdict(list)
+        for division_event_id, handicap_min, handicap_max, division_id, division_name in session.exec(
+            select(
+                EventDivision.event_id,
+                EventDivision.handicap_min,
+                EventDivision.handicap_max,
+                EventDivision.id,
+                EventDivision.name
+            ).where(
+                EventDivision.event_id.in_(event_ids),
+                EventDivision.use_course_handicap_for_assignment == True
+            )
+        ):
+            divisions_by_event[division_event_id].append((handicap_min, handicap_max, division_id, division_name))
+
+        # Prefetch all participants for these events at once, projecting only the
+        # columns used below plus the teebox slope rating behind course_handicap
+        participants_by_event = defaultdict(list)
+        for row in session.exec(
+            select(
+                Participant.event_id,
+                Participant.id,
+                Participant.name,
+                Participant.declared_handicap,
+                Participant.division,
+                Participant.division_id,
+                Teebox.slope_rating
+            )
+            .outerjoin(EventDivision, Participant.division_id == EventDivision.id)
+            .outerjoin(Teebox, EventDivision.teebox_id == Teebox.id)
+            .where(Participant.event_id.in_(event_ids))
+        ):
+            participants_by_event[row[0]].append(row[1:])
+
+        # Pending (id, division_id, division) changes, written in one batch at the end
+        updates = []
 
         for event in events:
             print(f"Event: {event.name} (ID: {event.id})")
             print("-" * 90)
 
-            # Get divisions that use course handicap
-            divisions = session.exec(
-                select(EventDivision).where(
-                    EventDivision.event_id == event.id,
-                    EventDivision.use_course_handicap_for_assignment == True
-                )
-            ).all()
+            divisions = divisions_by_event[event.id]
 
             if not divisions:
                 print(f"[SKIP] No divisions use course handicap for assignment\n")
                 continue
 
             # Sort divisions by handicap_min for proper matching
-            divisions = sorted(divisions, key=lambda d: d.handicap_min or 0)
+            division_ranges = sorted(
+                division for division in divisions
+                if division[0] is not None and division[1] is not None
+            )
+            range_starts = [division_range[0] for division_range in division_ranges]
 
-            # Get all participants for this event
-            participants = session.exec(
-                select(Participant).where(Participant.event_id == event.id)
-            ).all()
+            participants = participants_by_event[event.id]
 
             if not participants:
                 print(f"[SKIP] No participants found\n")
@@ -83,35 +133,34 @@ def reassign_participants(event_id: int = None):
             print(f"{'Name':<15} {'Old Division':<20} {'Course HCP':<12} {'New Division':<20}")
             print("-" * 90)
 
-            for participant in participants:
-                course_hcp = participant.course_handicap
-                old_division = participant.division or "None"
+            for participant_id, name, declared_handicap, division, division_id, slope_rating in participants:
+                course_hcp = Participant.calculate_course_handicap(declared_handicap, slope_rating)
+                old_division = division or "None"
 
                 # Find correct division based on course handicap
-                new_division = None
-                for division in divisions:
-                    if division.handicap_min is not None and division.handicap_max is not None:
-                        if division.handicap_min <= course_hcp <= division.handicap_max:
-                            new_division = division
-                            break
+                new_division = find_division(division_ranges, range_starts, course_hcp)
 
                 if new_division:
+                    _, _, new_division_id, new_division_name = new_division
                     # Only update if changed
-                    if participant.division_id != new_division.id:
-                        participant.division_id = new_division.id
-                        participant.division = new_division.name
-                        session.add(participant)
-                        total_reassigned += 1
-                        print(f"{participant.name:<15} {old_division:<20} {course_hcp:<12} {new_division.name:<20} [UPDATED]")
+                    if division_id != new_division_id:
+                        updates.append({
+                            "id": participant_id,
+                            "division_id": new_division_id,
+                            "division": new_division_name,
+                        })
+                        print(f"{name:<15} {old_division:<20} {course_hcp:<12} {new_division_name:<20} [UPDATED]")
                     else:
-                        print(f"{participant.name:<15} {old_division:<20} {course_hcp:<12} {new_division.name:<20} [OK]")
+                        print(f"{name:<15} {old_division:<20} {course_hcp:<12} {new_division_name:<20} [OK]")
                 else:
-                    print(f"{participant.name:<15} {old_division:<20} {course_hcp:<12} {'NO MATCH':<20} [ERROR]")
+                    print(f"{name:<15} {old_division:<20} {course_hcp:<12} {'NO MATCH':<20} [ERROR]")
 
             print()
 
-        # Commit changes
+        # Commit changes as a single executemany UPDATE keyed by primary key
+        total_reassigned = len(updates)
         if total_reassigned > 0:
+            session.execute(update(Participant), updates)
             session.commit()
             print("\n" + "="*90)
             print(f"SUMMARY: Reassigned {total_reassigned} participant(s)")
@@ -10,14 +10,49 @@ from datetime import datetime
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from sqlmodel import Session, select
-from core.database import engine
+from sqlmodel import select, func, delete
+from core.database import SessionLocal
 from models.event import Event, ScoringType
 from models.event_division import EventDivision
 from models.participant import Participant
+from models.scorecard import Scorecard
 from models.course import Course
 from models.user import User
 
+# Number of participants inserted per bulk INSERT batch
+BATCH_SIZE = 1000
+
+# Handicap range by division name marker, checked in order (first match wins)
+DIVISION_HANDICAP_RANGES = (
+    ('A', (0, 12)),
+    ('B', (13, 18)),
+    ('C', (19, 24)),
+)
+# Range for every other division (Ladies, Senior, ...)
+DEFAULT_HANDICAP_RANGE = (0, 36)
+
+
+def get_handicap_range(div_name: str) -> tuple:
+    """Determine the (min, max) handicap range for a division name"""
+    for marker, handicap_range in DIVISION_HANDICAP_RANGES:
+        if marker in div_name:
+            return handicap_range
+    return DEFAULT_HANDICAP_RANGE
+
+
+def insert_participant_batch(session, insert_participants, batch: list) -> int:
+    """Insert a batch of participant rows, returning how many were inserted
+
+    Each batch runs in a savepoint so a failed batch doesn't abort the others.
+    """
+    try:
+        with session.begin_nested():
+            session.execute(insert_participants, batch)
+        return len(batch)
+    except Exception as e:
+        print(f"  ERROR restoring batch of {len(batch)} participants: {e}")
+        return 0
+
 
 def restore_participants_from_backup(backup_file_path: str):
     """Restore participants from a JSON backup file"""
@@ -33,7 +68,7 @@ def restore_participants_from_backup(backup_file_path: str):
     print(f"Backup info: {backup_info}")
     print(f"Total participants in backup: {len(participants_data)}")
 
-    with Session(engine) as session:
+    with SessionLocal() as session:
         # Check if event exists, create if not
         event_id = backup_info.get('event_id', 1)
         event = session.get(Event, event_id)
@@ -94,24 +129,13 @@ def restore_participants_from_backup(backup_file_path: str):
                 print(f"Creating division: {div_name}")
 
                 # Determine handicap range based on division name
-                if 'A' in div_name:
-                    min_hcp, max_hcp = 0, 12
-                elif 'B' in div_name:
-                    min_hcp, max_hcp = 13, 18
-                elif 'C' in div_name:
-                    min_hcp, max_hcp = 19, 24
-                elif 'LADIES' in div_name.upper():
-                    min_hcp, max_hcp = 0, 36
-                elif 'SENIOR' in div_name.upper():
-                    min_hcp, max_hcp = 0, 36
-                else:
-                    min_hcp, max_hcp = 0, 36
+                min_hcp, max_hcp = get_handicap_range(div_name)
 
                 new_division = EventDivision(
                     event_id=event.id,
                     name=div_name,
-                    min_handicap=min_hcp,
-                    max_handicap=max_hcp
+                    handicap_min=min_hcp,
+                    handicap_max=max_hcp
                 )
                 session.add(new_division)
                 session.flush()
@@ -122,48 +146,57 @@ def restore_participants_from_backup(backup_file_path: str):
 
         # Delete existing participants for this event (optional - comment out if you want to keep existing)
         print(f"\nDeleting existing participants for event {event.id}...")
-        existing_participants = session.exec(
-            select(Participant).where(Participant.event_id == event.id)
-        ).all()
-        for p in existing_participants:
-            session.delete(p)
+        event_participant_ids = select(Participant.id).where(Participant.event_id == event.id)
+        # Bulk DELETE bypasses the ORM cascade, so remove their scorecards explicitly
+        session.exec(delete(Scorecard).where(Scorecard.participant_id.in_(event_participant_ids)))
+        result = session.exec(delete(Participant).where(Participant.event_id == event.id))
         session.commit()
-        print(f"Deleted {len(existing_participants)} existing participants")
+        print(f"Deleted {result.rowcount} existing participants")
 
         # Restore participants
         print(f"\nRestoring participants...")
         restored_count = 0
         skipped_count = 0
+        batch = []
+        # Compiled once and reused for every executemany batch (bypasses ORM unit of work)
+        insert_participants = Participant.__table__.insert()
+
+        def flush_batch():
+            nonlocal restored_count, skipped_count
+            inserted = insert_participant_batch(session, insert_participants, batch)
+            restored_count += inserted
+            skipped_count += len(batch) - inserted
+            batch.clear()
 
         for p_data in participants_data:
             try:
-                # Determine division_id
-                division_id = None
-                if p_data.get('division') and p_data['division'] in division_map:
-                    division_id = division_map[p_data['division']]
-
-                # Create participant
-                participant = Participant(
-                    event_id=event.id,
-                    name=p_data['name'],
-                    declared_handicap=p_data.get('declared_handicap', 0.0),
-                    division_id=division_id,
-                    country=p_data.get('country'),
-                    sex=p_data.get('sex'),
-                    phone_no=p_data.get('phone_no'),
-                    event_status=p_data.get('event_status', 'Ok'),
-                    event_description=p_data.get('event_description')
-                )
-                session.add(participant)
-                restored_count += 1
-
-                if restored_count % 10 == 0:
+                # Determine division_id (None when missing or unknown)
+                division_id = division_map.get(p_data.get('division'))
+
+                # Create participant row
+                batch.append({
+                    'event_id': event.id,
+                    'name': p_data['name'],
+                    'declared_handicap': p_data.get('declared_handicap', 0.0),
+                    'division_id': division_id,
+                    'country': p_data.get('country'),
+                    'sex': p_data.get('sex'),
+                    'phone_no': p_data.get('phone_no'),
+                    'event_status': p_data.get('event_status', 'Ok'),
+                    'event_description': p_data.get('event_description')
+                })
+
+                if len(batch) >= BATCH_SIZE:
+                    flush_batch()
                     print(f"  Restored {restored_count} participants...")
 
             except Exception as e:
                 print(f"  ERROR restoring participant {p_data.get('name')}: {e}")
                 skipped_count += 1
 
+        if batch:
+            flush_batch()
+
         session.commit()
 
         print(f"\n{'='*60}")
@@ -175,23 +208,20 @@ def restore_participants_from_backup(backup_file_path: str):
         print(f"  Participants skipped: {skipped_count}")
         print(f"{'='*60}")
 
+        # Count participants per division in a single query
+        division_counts = dict(session.exec(
+            select(Participant.division_id, func.count())
+            .where(Participant.event_id == event.id)
+            .group_by(Participant.division_id)
+        ).all())
+
         # Show division summary
         print(f"\nDivision Summary:")
         for div_name, div_id in division_map.items():
-            count = session.exec(
-                select(Participant)
-                .where(Participant.event_id == event.id)
-                .where(Participant.division_id == div_id)
-            ).all()
-            print(f"  {div_name}: {len(count)} participants")
+            print(f"  {div_name}: {division_counts.get(div_id, 0)} participants")
 
         # Show unassigned
-        unassigned = session.exec(
-            select(Participant)
-            .where(Participant.event_id == event.id)
-            .where(Participant.division_id == None)
-        ).all()
-        print(f"  Unassigned: {len(unassigned)} participants")
+        print(f"  Unassigned: {division_counts.get(None, 0)} participants")
 
 
 if __name__ == "__main__":
@@ -5,33 +5,132 @@ Script to restore participants from backup JSON file to Event ID 2
 import sys
 import os
 import json
+import time
 from datetime import datetime
 
+# ijson lets large backups be streamed instead of loaded into memory at once
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# orjson parses a whole backup several times faster than json when
+# streaming isn't available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from sqlmodel import Session, select
-from core.database import engine
+from sqlmodel import Session, select, delete, func
+from core.database import SessionLocal
 from models.event import Event
 from models.event_division import EventDivision
 from models.participant import Participant
+from models.scorecard import Scorecard
+
+# Number of participants inserted per bulk INSERT batch
+BATCH_SIZE = 500
+
+# Minimum seconds between restore progress lines
+PROGRESS_INTERVAL = 1.0
+
+# (min handicap, max handicap, division type) by upper-cased division name
+# marker, checked in order so e.g. LADIES wins over its 'A' substring
+DIVISION_RULES = (
+    (('LADIES', 'WOMEN'), (0, 36, 'women')),
+    (('SENIOR',), (0, 36, 'senior')),
+    (('VIP',), (0, 36, 'vip')),
+    (('A',), (0, 12, 'men')),
+    (('B',), (13, 18, 'men')),
+    (('C',), (19, 24, 'men')),
+    (('MEN',), (0, 36, 'men')),
+)
+DEFAULT_DIVISION_RULE = (0, 36, 'mixed')
+
+
+def classify_division(div_name: str) -> tuple:
+    """Determine (min handicap, max handicap, division type) from a division name"""
+    upper_name = div_name.upper()
+    for markers, classification in DIVISION_RULES:
+        if any(marker in upper_name for marker in markers):
+            return classification
+    return DEFAULT_DIVISION_RULE
+
+
+# Top-level backup sections yielded by iter_backup, by ijson prefix
+BACKUP_SECTIONS = {
+    'backup_info': 'backup_info',
+    'divisions': 'divisions',
+    'participants.item': 'participant',
+}
+
+
+def iter_backup(backup_file_path: str):
+    """Yield (section, value) pairs from a backup file in file order
+
+    Sections are ('backup_info', dict), ('divisions', list) and one
+    ('participant', dict) per participant. With ijson the file is parsed
+    once, incrementally, and only one participant record is built at a time;
+    otherwise the whole file is loaded with orjson, or json as a last resort.
+    """
+    if HAS_IJSON:
+        with open(backup_file_path, 'rb') as f:
+            builder = None
+            for prefix, event, value in ijson.parse(f, use_float=True):
+                if builder is None:
+                    if prefix in BACKUP_SECTIONS and event in ('start_map', 'start_array'):
+                        section, section_prefix = BACKUP_SECTIONS[prefix], prefix
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                    continue
+
+                builder.event(event, value)
+                if prefix == section_prefix and event in ('end_map', 'end_array'):
+                    yield section, builder.value
+                    builder = None
+        return
+
+    if HAS_ORJSON:
+        with open(backup_file_path, 'rb') as f:
+            backup_data = orjson.loads(f.read())
+    else:
+        with open(backup_file_path, 'r', encoding='utf-8') as f:
+            backup_data = json.load(f)
+
+    for section in ('backup_info', 'divisions'):
+        if backup_data.get(section) is not None:
+            yield section, backup_data[section]
+    for p_data in backup_data.get('participants', []):
+        yield 'participant', p_data
+
+
+def insert_participant_batch(session: Session, batch: list) -> int:
+    """Insert a batch of participant rows, returning how many were inserted
+
+    Each batch runs in a savepoint so a failed batch doesn't abort the others.
+    """
+    try:
+        with session.begin_nested():
+            session.bulk_insert_mappings(Participant, batch)
+        return len(batch)
+    except Exception as e:
+        print(f"  ERROR restoring batch of {len(batch)} participants: {e}")
+        return 0
 
 
 def restore_participants_to_event2(backup_file_path: str):
     """Restore participants from a JSON backup file to Event ID 2"""
 
-    # Read backup file
     print(f"Reading backup file: {backup_file_path}")
-    with open(backup_file_path, 'r', encoding='utf-8') as f:
-        backup_data = json.load(f)
-
-    backup_info = backup_data.get('backup_info', {})
-    participants_data = backup_data.get('participants', [])
 
-    print(f"Backup info: {backup_info}")
-    print(f"Total participants in backup: {len(participants_data)}")
-
-    with Session(engine) as session:
+    # One transaction for the whole restore: committed once at the end and
+    # rolled back entirely on error. Flushes only happen where IDs are needed.
+    with SessionLocal(autoflush=False) as session, session.begin():
         # Use Event ID 2
         event_id = 2
         event = session.get(Event, event_id)
@@ -51,106 +150,123 @@ def restore_participants_to_event2(backup_file_path: str):
         for div in existing_divisions:
             division_map[div.name] = div.id
 
-        # Identify unique divisions from backup
-        unique_divisions = set()
-        for p in participants_data:
-            if p.get('division'):
-                unique_divisions.add(p['division'])
-
-        print(f"\nUnique divisions found in backup: {unique_divisions}")
-        print(f"Existing divisions in event: {[d.name for d in existing_divisions]}")
-
-        # Create missing divisions
-        for div_name in unique_divisions:
-            if div_name not in division_map:
-                print(f"Creating division: {div_name}")
-
-                # Determine handicap range based on division name
-                if 'A' in div_name:
-                    min_hcp, max_hcp = 0, 12
-                elif 'B' in div_name:
-                    min_hcp, max_hcp = 13, 18
-                elif 'C' in div_name:
-                    min_hcp, max_hcp = 19, 24
-                elif 'LADIES' in div_name.upper():
-                    min_hcp, max_hcp = 0, 36
-                elif 'SENIOR' in div_name.upper():
-                    min_hcp, max_hcp = 0, 36
-                else:
-                    min_hcp, max_hcp = 0, 36
-
-                # Determine division type based on division name
-                division_type = None
-                if 'MEN' in div_name.upper() or 'A' in div_name or 'B' in div_name or 'C' in div_name:
-                    division_type = "men"
-                elif 'LADIES' in div_name.upper() or 'WOMEN' in div_name.upper():
-                    division_type = "women"
-                elif 'SENIOR' in div_name.upper():
-                    division_type = "senior"
-                elif 'VIP' in div_name.upper():
-                    division_type = "vip"
-                else:
-                    division_type = "mixed"
-
-                new_division = EventDivision(
-                    event_id=event.id,
-                    name=div_name,
-                    division_type=division_type,
-                    handicap_min=min_hcp,
-                    handicap_max=max_hcp
-                )
-                session.add(new_division)
-                session.flush()
-                division_map[div_name] = new_division.id
-                print(f"  Created division ID: {new_division.id}")
-
-        session.commit()
+        print(f"Existing divisions in event: {list(division_map)}")
 
-        # Delete existing participants for this event (if any)
+        # Delete existing participants for this event (if any) before the
+        # backup is streamed in
         print(f"\nDeleting existing participants for event {event.id}...")
-        existing_participants = session.exec(
-            select(Participant).where(Participant.event_id == event.id)
-        ).all()
-        for p in existing_participants:
-            session.delete(p)
-        session.commit()
-        print(f"Deleted {len(existing_participants)} existing participants")
-
-        # Restore participants
+        event_participant_ids = select(Participant.id).where(Participant.event_id == event.id)
+        # Bulk DELETE bypasses the ORM cascade, so remove their scorecards explicitly
+        session.exec(delete(Scorecard).where(Scorecard.participant_id.in_(event_participant_ids)))
+        result = session.exec(delete(Participant).where(Participant.event_id == event.id))
+        deleted_count = result.rowcount
+        print(f"Deleted {deleted_count} existing participants")
+
+        # Classification recorded by the backup; name-based rules are only the
+        # fallback for older backup files
+        division_classifications = {}
+        new_divisions = {}  # Divisions created by this restore, by name
+        pending_divisions = []  # New divisions not flushed yet
+
+        # Single pass over the backup: participants are inserted in
+        # BATCH_SIZE batches as they are read, so at most one batch is held
         print(f"\nRestoring participants to Event ID {event_id}...")
+        batch = []
+        batch_division_names = []  # Division name of each row in batch
         restored_count = 0
         skipped_count = 0
+        last_progress = time.monotonic()
 
-        for p_data in participants_data:
-            try:
-                # Determine division_id
-                division_id = None
-                if p_data.get('division') and p_data['division'] in division_map:
-                    division_id = division_map[p_data['division']]
+        def flush_batch():
+            nonlocal restored_count, skipped_count, last_progress
+            if pending_divisions:
+                # One flush assigns IDs to every division the batch introduced
+                session.add_all(pending_divisions)
+                session.flush()
+                for division in pending_divisions:
+                    division_map[division.name] = division.id
+                    print(f"Created division: {division.name} (ID: {division.id})")
+                pending_divisions.clear()
+
+            for row, div_name in zip(batch, batch_division_names):
+                row['division_id'] = division_map.get(div_name)
+
+            if batch:
+                inserted = insert_participant_batch(session, batch)
+                restored_count += inserted
+                skipped_count += len(batch) - inserted
+            batch.clear()
+            batch_division_names.clear()
+
+            now = time.monotonic()
+            if now - last_progress >= PROGRESS_INTERVAL:
+                print(f"  Restored {restored_count} participants...")
+                last_progress = now
+
+        for section, value in iter_backup(backup_file_path):
+            if section == 'backup_info':
+                print(f"Backup info: {value}")
+                print(f"Total participants in backup: {value.get('total_participants', 'unknown')}")
+                continue
+
+            if section == 'divisions':
+                division_classifications = {
+                    d['name']: (d.get('handicap_min'), d.get('handicap_max'), d.get('division_type'))
+                    for d in value
+                }
+                # Backups list divisions before participants; should one not,
+                # divisions already created from names are corrected here
+                for name, division in new_divisions.items():
+                    if name in division_classifications:
+                        division.handicap_min, division.handicap_max, division.division_type = (
+                            division_classifications[name]
+                        )
+                continue
+
+            p_data = value
+            div_name = p_data.get('division')
+
+            if div_name and div_name not in division_map and div_name not in new_divisions:
+                # Use the backup's handicap range and division type, else derive from the name
+                min_hcp, max_hcp, division_type = (
+                    division_classifications.get(div_name) or classify_division(div_name)
+                )
 
-                # Create participant
-                participant = Participant(
+                new_division = EventDivision(
                     event_id=event.id,
-                    name=p_data['name'],
-                    declared_handicap=p_data.get('declared_handicap', 0.0),
-                    division_id=division_id,
-                    country=p_data.get('country'),
-                    sex=p_data.get('sex'),
-                    phone_no=p_data.get('phone_no'),
-                    event_status=p_data.get('event_status', 'Ok'),
-                    event_description=p_data.get('event_description')
+                    name=div_name,
+                    division_type=division_type,
+                    handicap_min=min_hcp,
+                    handicap_max=max_hcp
                 )
-                session.add(participant)
-                restored_count += 1
-
-                if restored_count % 10 == 0:
-                    print(f"  Restored {restored_count} participants...")
+                # Added and flushed with the batch, which needs its ID
+                pending_divisions.append(new_division)
+                new_divisions[div_name] = new_division
 
+            try:
+                # Plain row mappings; bulk_insert_mappings skips ORM instance tracking
+                batch.append({
+                    'event_id': event.id,
+                    'name': p_data['name'],
+                    'declared_handicap': p_data.get('declared_handicap', 0.0),
+                    'country': p_data.get('country'),
+                    'sex': p_data.get('sex'),
+                    'phone_no': p_data.get('phone_no'),
+                    'event_status': p_data.get('event_status', 'Ok'),
+                    'event_description': p_data.get('event_description')
+                })
+                batch_division_names.append(div_name)
             except Exception as e:
                 print(f"  ERROR restoring participant {p_data.get('name')}: {e}")
                 skipped_count += 1
 
-        session.commit()
+            if len(batch) >= BATCH_SIZE:
+                flush_batch()
+
+        if batch or pending_divisions:
+            flush_batch()
+
+        print(f"\nNew divisions found in backup: {list(new_divisions)}")
 
         print(f"\n{'='*60}")
         print(f"Restoration complete!")
@@ -161,23 +277,20 @@ def restore_participants_to_event2(backup_file_path: str):
         print(f"  Participants skipped: {skipped_count}")
         print(f"{'='*60}")
 
+        # Count participants per division in a single query
+        division_counts = dict(session.exec(
+            select(Participant.division_id, func.count())
+            .where(Participant.event_id == event.id)
+            .group_by(Participant.division_id)
+        ).all())
+
         # Show division summary
         print(f"\nDivision Summary:")
         for div_name, div_id in division_map.items():
-            count = session.exec(
-                select(Participant)
-                .where(Participant.event_id == event.id)
-                .where(Participant.division_id == div_id)
-            ).all()
-            print(f"  {div_name}: {len(count)} participants")
+            print(f"  {div_name}: {division_counts.get(div_id, 0)} participants")
 
         # Show unassigned
-        unassigned = session.exec(
-            select(Participant)
-            .where(Participant.event_id == event.id)
-            .where(Participant.division_id == None)
-        ).all()
-        print(f"  Unassigned: {len(unassigned)} participants")
+        print(f"  Unassigned: {division_counts.get(None, 0)} participants")
 
 
 if __name__ == "__main__":
@@ -24,6 +24,7 @@ from core.database import engine
 from models.scorecard import Scorecard
 from models.participant import Participant
 from models.event import Event
+from models.course import Hole
 
 # API base URL
 BASE_URL = "http://localhost:8000/api/v1"
@@ -35,6 +36,8 @@ class EndToEndWorkflowTester:
     def __init__(self):
         self.token = None
         self.session = Session(engine)
+        # Shared HTTP session so all API calls reuse one keep-alive connection
+        self.http = requests.Session()
         self.test_results = {
             'total_tests': 0,
             'passed': 0,
@@ -65,6 +68,7 @@ class EndToEndWorkflowTester:
             import traceback
             traceback.print_exc()
         finally:
+            self.http.close()
             self.session.close()
 
     def login(self):
@@ -72,7 +76,7 @@ class EndToEndWorkflowTester:
         print("[SETUP] Logging in to API...")
 
         try:
-            response = requests.post(
+            response = self.http.post(
                 f"{BASE_URL}/auth/login",
                 json={
                     "email": "admin@abhimatagolf.com",
@@ -82,6 +86,7 @@ class EndToEndWorkflowTester:
 
             if response.status_code == 200:
                 self.token = response.json()["access_token"]
+                self.http.headers["Authorization"] = f"Bearer {self.token}"
                 print("[OK] Login successful\n")
                 return True
             else:
@@ -123,16 +128,14 @@ class EndToEndWorkflowTester:
         print(f"          Strokes: {test_strokes}")
 
         try:
-            headers = {"Authorization": f"Bearer {self.token}"}
             # API uses query parameters: POST /scorecards/?participant_id=X&hole_number=Y&strokes=Z
-            response = requests.post(
+            response = self.http.post(
                 f"{BASE_URL}/scorecards/",
                 params={
                     "participant_id": participant.id,
                     "hole_number": test_hole_number,
                     "strokes": test_strokes
-                },
-                headers=headers
+                }
             )
 
             if response.status_code in [200, 201]:
@@ -157,26 +160,16 @@ class EndToEndWorkflowTester:
         # Step 2: Verify calculated values in database
         print(f"\n  Step 2: Verify values stored in database")
 
-        # Refresh session to get latest data
-        self.session.expire_all()
-
-        # Get hole_id from hole_number
-        from models.course import Hole
-        hole = self.session.exec(
-            select(Hole)
-            .where(Hole.course_id == event.course_id)
-            .where(Hole.number == test_hole_number)
-        ).first()
-
-        if not hole:
-            print(f"  [FAIL] Hole {test_hole_number} not found")
-            self.test_results['failed'] += 1
-            return
-
+        # Resolve the hole by number in the same query as the scorecard.
+        # populate_existing refreshes just this row with what the API wrote,
+        # without expiring every other object in the session.
         scorecard = self.session.exec(
             select(Scorecard)
+            .join(Hole, Scorecard.hole_id == Hole.id)
             .where(Scorecard.participant_id == participant.id)
-            .where(Scorecard.hole_id == hole.id)
+            .where(Hole.course_id == event.course_id)
+            .where(Hole.number == test_hole_number)
+            .execution_options(populate_existing=True)
         ).first()
 
         if not scorecard:
@@ -218,10 +211,8 @@ class EndToEndWorkflowTester:
         print(f"\n  Step 3: Verify leaderboard reflects stored values")
 
         try:
-            headers = {"Authorization": f"Bearer {self.token}"}
-            response = requests.get(
-                f"{BASE_URL}/leaderboards/event/{event.id}?use_cache=false",
-                headers=headers
+            response = self.http.get(
+                f"{BASE_URL}/leaderboards/event/{event.id}?use_cache=false"
             )
 
             if response.status_code == 200:
@@ -231,11 +222,10 @@ class EndToEndWorkflowTester:
                 print(f"          Participants with scores: {leaderboard['participants_with_scores']}")
 
                 # Find our participant in the leaderboard
-                our_entry = None
-                for entry in leaderboard['entries']:
-                    if entry['participant_id'] == participant.id:
-                        our_entry = entry
-                        break
+                entries_by_participant = {
+                    entry['participant_id']: entry for entry in leaderboard['entries']
+                }
+                our_entry = entries_by_participant.get(participant.id)
 
                 if our_entry:
                     print(f"\n  [PASS] Participant found in leaderboard")
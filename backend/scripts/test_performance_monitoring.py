@@ -10,10 +10,13 @@ Tests:
 6. Statistics generation
 """
 
+import io
 import os
 import sys
-import time
 import asyncio
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Add backend to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -27,17 +30,41 @@ from core.performance_monitoring import (
     log_performance_summary,
     ResourceMonitor
 )
+from scripts._test_utils import ThreadCapturedStdout
 
 # Test markers
 OK = "[OK]"
 FAIL = "[FAIL]"
 INFO = "[INFO]"
 
+class FakeClock:
+    """Nanosecond clock that only moves when advanced, for exact durations"""
+
+    def __init__(self):
+        self.ns = 0
+
+    def now(self):
+        return self.ns
+
+    def advance_ms(self, ms):
+        self.ns += int(ms * 1_000_000)
+
+BANNER = "=" * 70
+
+# Event loop shared by the suite's async tests (set by run_all_tests)
+event_loop = None
+event_loop_lock = threading.Lock()
+
+def run_async(coro):
+    """Run a coroutine on the suite's event loop, or a fresh one when run alone"""
+    if event_loop is None:
+        return asyncio.run(coro)
+    with event_loop_lock:  # Tests run on worker threads; one loop runs one at a time
+        return event_loop.run_until_complete(coro)
+
 def print_section(title):
     """Print section header"""
-    print(f"\n{'='*70}")
-    print(f"{title}")
-    print(f"{'='*70}\n")
+    print(f"\n{BANNER}\n{title}\n{BANNER}\n")
 
 def test_request_tracking():
     """Test 1: Request tracking"""
@@ -154,24 +181,27 @@ def test_context_managers():
     """Test 5: Context managers"""
     print_section("Test 5: Context Managers")
 
-    metrics = get_performance_metrics()
-    metrics.reset()
+    clock = FakeClock()
+    metrics = PerformanceMetrics(clock=clock.now)
 
     # Test request tracking
-    with track_request_time("/api/v1/test", "GET"):
-        time.sleep(0.05)
+    with track_request_time("/api/v1/test", "GET", metrics):
+        clock.advance_ms(50)
 
     print(f"{INFO} Tracked request with context manager")
 
     # Test query tracking
-    with track_query_time("SELECT", "SELECT * FROM test"):
-        time.sleep(0.02)
+    with track_query_time("SELECT", "SELECT * FROM test", metrics):
+        clock.advance_ms(20)
 
     print(f"{INFO} Tracked query with context manager")
 
     stats = metrics.get_statistics()
+    print(f"{INFO} Request duration: {stats['requests']['avg_duration_ms']:.2f}ms")
+    print(f"{INFO} Query duration: {stats['queries']['avg_duration_ms']:.2f}ms")
 
-    if stats['requests']['total_count'] == 1 and stats['queries']['total_count'] == 1:
+    if (stats['requests']['total_count'] == 1 and stats['queries']['total_count'] == 1 and
+        stats['requests']['avg_duration_ms'] == 50 and stats['queries']['avg_duration_ms'] == 20):
         print(f"{OK} Context managers working correctly")
         return True
     else:
@@ -182,25 +212,26 @@ def test_decorators():
     """Test 6: Performance decorators"""
     print_section("Test 6: Performance Decorators")
 
-    metrics = get_performance_metrics()
-    metrics.reset()
+    clock = FakeClock()
+    metrics = PerformanceMetrics(clock=clock.now)
 
     # Test synchronous decorator
-    @monitor_performance("/api/v1/sync_test")
+    @monitor_performance("/api/v1/sync_test", metrics)
     def sync_function():
-        time.sleep(0.03)
+        clock.advance_ms(30)
         return "done"
 
     result = sync_function()
     print(f"{INFO} Sync function result: {result}")
 
     # Test async decorator
-    @monitor_performance("/api/v1/async_test")
+    @monitor_performance("/api/v1/async_test", metrics)
     async def async_function():
-        await asyncio.sleep(0.02)
+        clock.advance_ms(20)
+        await asyncio.sleep(0)  # Keep a suspension point
         return "done"
 
-    result = asyncio.run(async_function())
+    result = run_async(async_function())
     print(f"{INFO} Async function result: {result}")
 
     stats = metrics.get_statistics()
@@ -220,9 +251,16 @@ def test_endpoint_statistics():
 
     # Record multiple requests to same endpoint
     endpoint = "/api/v1/events"
-    for i in range(5):
-        duration = 0.05 + (i * 0.01)  # Varying durations
-        metrics.record_request(endpoint, "GET", duration, 200)
+    durations = [0.05 + (i * 0.01) for i in range(5)]  # Varying durations
+    metrics.record_requests_bulk(endpoint, "GET", durations, [200] * len(durations))
+
+    # Mismatched sample lengths are rejected without recording anything
+    try:
+        metrics.record_requests_bulk(endpoint, "GET", durations, [200])
+        print(f"{FAIL} Mismatched status codes were accepted")
+        return False
+    except ValueError:
+        print(f"{OK} Mismatched status codes rejected")
 
     # One error
     metrics.record_request(endpoint, "GET", 0.1, 500, error=True)
@@ -271,11 +309,26 @@ def test_performance_summary():
         print(f"{FAIL} Performance summary failed")
         return False
 
+def run_test(name, test_func):
+    """Run one test, reporting a crash as a failure"""
+    try:
+        return test_func()
+    except Exception as e:
+        print(f"{FAIL} Test '{name}' crashed: {e}")
+        sys.stdout.write("".join(traceback.format_exception(e)))  # One write per failure
+        return False
+
+def run_test_captured(name, test_func, stdout):
+    """Run one test with its prints buffered, returning (result, printed output)"""
+    stdout.local.buffer = io.StringIO()
+    try:
+        return run_test(name, test_func), stdout.local.buffer.getvalue()
+    finally:
+        stdout.local.buffer = None
+
 def run_all_tests():
     """Run all performance monitoring tests"""
-    print("\n" + "="*70)
-    print("PHASE 6 TASK 6.3 - PERFORMANCE MONITORING TEST SUITE")
-    print("="*70)
+    print(f"\n{BANNER}\nPHASE 6 TASK 6.3 - PERFORMANCE MONITORING TEST SUITE\n{BANNER}")
 
     tests = [
         ("Request Tracking", test_request_tracking),
@@ -288,20 +341,46 @@ def run_all_tests():
         ("Performance Summary", test_performance_summary),
     ]
 
-    results = []
-    for name, test_func in tests:
-        try:
-            result = test_func()
-            results.append((name, result))
-        except Exception as e:
-            print(f"{FAIL} Test '{name}' crashed: {e}")
-            import traceback
-            traceback.print_exc()
-            results.append((name, False))
+    # Tests with their own PerformanceMetrics run concurrently; the summary
+    # test resets and reads the global instance, so it runs afterwards
+    serial_tests = {test_performance_summary}
+    parallel = [(name, func) for name, func in tests if func not in serial_tests]
+    serial = [(name, func) for name, func in tests if func in serial_tests]
+
+    # Create the shared logging service before workers race to initialize it
+    get_performance_metrics()
+
+    # One event loop for the whole suite instead of one per asyncio.run()
+    global event_loop
+    event_loop = asyncio.new_event_loop()
+
+    outcomes = {}
+    stdout = sys.stdout = ThreadCapturedStdout(sys.stdout)
+    try:
+        with ThreadPoolExecutor(max_workers=len(parallel)) as executor:
+            futures = {
+                executor.submit(run_test_captured, name, func, stdout): name
+                for name, func in parallel
+            }
+            # Write each test's output as one block, in completion order
+            for future in as_completed(futures):
+                outcomes[futures[future]], output = future.result()
+                stdout.stream.write(output)
+
+        for name, test_func in serial:
+            outcomes[name], output = run_test_captured(name, test_func, stdout)
+            stdout.stream.write(output)
+    finally:
+        sys.stdout = stdout.stream
+        event_loop.close()
+        event_loop = None
+
+    # Already sized and in test order; no appends while collecting
+    results = [(name, outcomes[name]) for name, _ in tests]
 
     # Summary
     print_section("TEST SUMMARY")
-    passed = sum(1 for _, result in results if result)
+    passed = sum(map(bool, outcomes.values()))
     total = len(results)
 
     for name, result in results: